@@ -4,15 +4,21 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import copy
+import os
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 import yaml
 
 import config.settings as shared_settings
 from config.settings import ChatSettings, CrewSettings, McpServerSettings
 from repositories.config.settings import RepositoriesSettings
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 
 class RootSettings(BaseModel):
     chat: ChatSettings
@@ -28,13 +34,30 @@ REPOSITORIES_DIR = CONFIG_DIR.parent / "repositories"
 
 def _read_yaml_file(path: Path, *, required: bool = False) -> dict:
     """Read a YAML file with PyYAML and return a dictionary."""
-    if not path.exists():
+    try:
+        with open(path) as f:
+            return yaml.load(f, Loader=SafeLoader) or {}
+    except FileNotFoundError:
         if required:
-            raise FileNotFoundError(f"Required settings file not found: {path}")
+            raise FileNotFoundError(
+                f"Required settings file not found: {path}"
+            ) from None
         return {}
 
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+
+def _crew_config_dirs() -> list[tuple[str, Path]]:
+    """Return (crew name, config dir) for each crew that ships a settings.yaml."""
+    try:
+        with os.scandir(CREWS_DIR) as entries:
+            crew_dirs = [entry for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        return []
+
+    return [
+        (entry.name, Path(entry.path) / "config")
+        for entry in sorted(crew_dirs, key=lambda entry: entry.name)
+        if os.path.isfile(os.path.join(entry.path, "config", "settings.yaml"))
+    ]
 
 
 def _merge_local_override(merged: dict, config_dir: Path, namespace: list[str]) -> None:
@@ -49,16 +72,14 @@ def _merge_local_override(merged: dict, config_dir: Path, namespace: list[str])
     shared_settings.deep_merge(target, override)
 
 
-def _load_default_tree() -> dict:
+def _load_default_tree(crew_dirs: list[tuple[str, Path]]) -> dict:
     """Assemble module-local defaults into explicit namespaces."""
     merged = _read_yaml_file(CONFIG_DIR / "settings.yaml", required=True)
 
-    crews: dict[str, dict] = {}
-    if CREWS_DIR.exists():
-        for crew_dir in sorted(CREWS_DIR.iterdir(), key=lambda item: item.name):
-            settings_file = crew_dir / "config" / "settings.yaml"
-            if settings_file.exists():
-                crews[crew_dir.name] = _read_yaml_file(settings_file, required=True)
+    crews: dict[str, dict] = {
+        name: _read_yaml_file(config_dir / "settings.yaml", required=True)
+        for name, config_dir in crew_dirs
+    }
     if crews:
         merged["crews"] = crews
 
@@ -72,7 +93,7 @@ def _load_default_tree() -> dict:
 _MOUNTED_NAMESPACES = frozenset({"crews", "repositories"})
 
 
-def _apply_local_overrides(merged: dict) -> None:
+def _apply_local_overrides(merged: dict, crew_dirs: list[tuple[str, Path]]) -> None:
     """Apply module-local settings.local.yaml files after user overrides."""
     root_override = _read_yaml_file(CONFIG_DIR / "settings.local.yaml")
     if root_override:
@@ -80,11 +101,8 @@ def _apply_local_overrides(merged: dict) -> None:
         if scoped:
             shared_settings.deep_merge(merged, scoped)
 
-    if CREWS_DIR.exists():
-        for crew_dir in sorted(CREWS_DIR.iterdir(), key=lambda item: item.name):
-            config_dir = crew_dir / "config"
-            if (config_dir / "settings.yaml").exists():
-                _merge_local_override(merged, config_dir, ["crews", crew_dir.name])
+    for name, config_dir in crew_dirs:
+        _merge_local_override(merged, config_dir, ["crews", name])
 
     repo_config_dir = REPOSITORIES_DIR / "config"
     if (repo_config_dir / "settings.yaml").exists():
@@ -96,10 +114,11 @@ def _load_merged_config() -> dict:
     """Load the merged runtime configuration once per process."""
     load_dotenv()
 
-    merged = _load_default_tree()
+    crew_dirs = _crew_config_dirs()
+    merged = _load_default_tree(crew_dirs)
     user_config = _read_yaml_file(shared_settings.USER_CONFIG_FILE)
     shared_settings.deep_merge(merged, user_config)
-    _apply_local_overrides(merged)
+    _apply_local_overrides(merged, crew_dirs)
 
     return shared_settings.expand_tildes(merged)
 
@@ -112,3 +131,15 @@ def get_merged_config() -> dict:
 def get_settings() -> RootSettings:
     """Return a fresh typed settings object backed by the cached merged config."""
     return RootSettings.model_validate(_load_merged_config())
+
+
+def is_mcp_configured(server_name: str) -> bool:
+    """Return whether an MCP server has a valid entry in the cached merged config."""
+    entry = (_load_merged_config().get("mcpServers") or {}).get(server_name)
+    if entry is None:
+        return False
+    try:
+        McpServerSettings.model_validate(entry)
+    except ValidationError:
+        return False
+    return True
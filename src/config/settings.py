@@ -1,5 +1,6 @@
 """Shared configuration models and utilities used by config.root and typed settings."""
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -46,25 +47,22 @@ USER_CONFIG_FILE = Path.home() / ".cv-joint" / "settings.yaml"
 
 
 def expand_tildes(config: dict) -> dict:
-    """Recursively expand ~/ in string values to home directory paths."""
-    result = {}
-    for key, value in config.items():
-        if isinstance(value, dict):
-            result[key] = expand_tildes(value)
-        elif isinstance(value, list):
-            result[key] = [
-                str(Path(item).expanduser())
-                if isinstance(item, str) and item.startswith("~/")
-                else expand_tildes(item)
-                if isinstance(item, dict)
-                else item
-                for item in value
-            ]
-        elif isinstance(value, str) and value.startswith("~/"):
-            result[key] = str(Path(value).expanduser())
-        else:
-            result[key] = value
-    return result
+    """Expand ~/ in string values to home directory paths, in place."""
+    stack: list[dict | list] = [config]
+    while stack:
+        container = stack.pop()
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, value in items:
+            if isinstance(value, (dict, list)):
+                stack.append(value)
+            elif (
+                isinstance(value, str)
+                and value.startswith("~")
+                and len(value) > 1
+                and value[1] in ("/", os.sep)
+            ):
+                container[key] = str(Path(value).expanduser())
+    return config
 
 
 def deep_merge(base: dict, override: dict) -> None:
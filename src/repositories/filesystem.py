@@ -1,7 +1,9 @@
 import json
+import os
 import re
 import shutil
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, TypeVar
 
@@ -34,9 +36,14 @@ def _render_frontmatter(record: BaseModel) -> str:
     return f"---\n{yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)}---\n"
 
 
+_WORD_BOUNDARY = re.compile("(.)([A-Z][a-z]+)")
+_CASE_BOUNDARY = re.compile("([a-z0-9])([A-Z])")
+
+
+@lru_cache(maxsize=None)
 def _to_kebab_case(name: str) -> str:
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1-\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1-\2", s1).lower()
+    s1 = _WORD_BOUNDARY.sub(r"\1-\2", name)
+    return _CASE_BOUNDARY.sub(r"\1-\2", s1).lower()
 
 
 def parse_uri(uri: str) -> dict[str, str]:
@@ -99,16 +106,16 @@ class FileSystemRepository:
 
     def _load_collection(self, collection_file: Path) -> list[dict[str, Any]]:
         """Load collection metadata from JSON file."""
-        if not collection_file.exists():
+        try:
+            return json.loads(collection_file.read_bytes())
+        except FileNotFoundError:
             return []
 
-        with open(collection_file, "r") as f:
-            return json.load(f)
-
     def _save_collection(self, collection_file: Path, collection: list[dict[str, Any]]):
-        """Save collection metadata to JSON file."""
-        with open(collection_file, "w") as f:
-            json.dump(collection, f, indent=2)
+        """Save collection metadata to JSON file, replacing it atomically."""
+        tmp_file = collection_file.with_name(f".{collection_file.name}.tmp")
+        tmp_file.write_text(json.dumps(collection, indent=2))
+        os.replace(tmp_file, collection_file)
 
     def _resolve_path(self, relative_path: str) -> Path:
         """Resolve a relative path against data_dir."""
@@ -140,8 +147,7 @@ class FileSystemRepository:
         absolute_path = self._resolve_path(directory) / "job-posting.json"
         absolute_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(absolute_path, "w") as f:
-            json.dump(job_posting.model_dump(mode="json"), f, indent=2)
+        absolute_path.write_text(job_posting.model_dump_json(indent=2), encoding="utf-8")
 
         now = datetime.now()
         record = JobPostingRecord(
@@ -179,10 +185,7 @@ class FileSystemRepository:
             return None
 
         absolute_path = self._resolve_path(metadata["path"]) / "job-posting.json"
-        with open(absolute_path, "r") as f:
-            data = json.load(f)
-
-        return JobPosting(**data)
+        return JobPosting.model_validate_json(absolute_path.read_bytes())
 
     def get_job_posting_record(self, identifier: str) -> Optional[JobPostingRecord]:
         """
@@ -357,8 +360,7 @@ class FileSystemRepository:
         absolute_path = self._resolve_path(directory) / "curriculum-vitae.json"
         absolute_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(absolute_path, "w") as f:
-            json.dump(cv.model_dump(mode="json"), f, indent=2)
+        absolute_path.write_text(cv.model_dump_json(indent=2), encoding="utf-8")
 
         now = datetime.now()
         record = CurriculumVitaeRecord(
@@ -394,10 +396,7 @@ class FileSystemRepository:
             return None
 
         absolute_path = self._resolve_path(metadata["path"]) / "curriculum-vitae.json"
-        with open(absolute_path, "r") as f:
-            data = json.load(f)
-
-        return CurriculumVitae(**data)
+        return CurriculumVitae.model_validate_json(absolute_path.read_bytes())
 
     def get_cv_record(self, identifier: str) -> Optional[CurriculumVitaeRecord]:
         """
@@ -587,8 +586,7 @@ class FileSystemRepository:
         absolute_path = self._resolve_path(directory) / "cover-letter.json"
         absolute_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(absolute_path, "w") as f:
-            json.dump(cover_letter.model_dump(mode="json"), f, indent=2)
+        absolute_path.write_text(cover_letter.model_dump_json(indent=2), encoding="utf-8")
 
         now = datetime.now()
         record = CoverLetterRecord(
@@ -625,10 +623,7 @@ class FileSystemRepository:
             return None
 
         absolute_path = self._resolve_path(metadata["path"]) / "cover-letter.json"
-        with open(absolute_path, "r") as f:
-            data = json.load(f)
-
-        return CoverLetter(**data)
+        return CoverLetter.model_validate_json(absolute_path.read_bytes())
 
     def get_cover_letter_record(
         self, identifier: str
@@ -823,20 +818,26 @@ class FileSystemRepository:
     def load_object(self, base_uri: str, model_class: type[T]) -> Optional[T]:
         filename = _to_kebab_case(model_class.__name__) + ".json"
         path = self._resolve_path(base_uri) / filename
-        if not path.exists():
+        try:
+            data = json.loads(path.read_bytes())
+        except FileNotFoundError:
             return None
-        data = json.loads(path.read_text())
         data.pop("_type", None)
         return model_class(**data)
 
     def load_all_objects(self, base_uri: str) -> dict[str, BaseModel]:
         directory = self._resolve_path(base_uri)
-        if not directory.exists():
+        try:
+            entries = list(os.scandir(directory))
+        except (FileNotFoundError, NotADirectoryError):
             return {}
         results: dict[str, BaseModel] = {}
-        for json_file in directory.glob("*.json"):
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
             try:
-                data = json.loads(json_file.read_text())
+                with open(entry.path, "rb") as f:
+                    data = json.loads(f.read())
             except (json.JSONDecodeError, OSError):
                 continue
             type_name = data.get("_type")
@@ -844,7 +845,7 @@ class FileSystemRepository:
                 continue
             model_class = DOMAIN_OBJECT_REGISTRY[type_name]
             payload = {k: v for k, v in data.items() if k != "_type"}
-            results[json_file.stem] = model_class(**payload)
+            results[entry.name[: -len(".json")]] = model_class(**payload)
         return results
 
     # -------------------------------------------------------------------------
@@ -863,14 +864,20 @@ class FileSystemRepository:
             if stem in RECORD_DOCUMENTS.get(type(record), set()):
                 content = _render_frontmatter(record) + content
 
-        path.write_text(content)
+        data = content.encode("utf-8")
+        try:
+            if path.read_bytes() == data:
+                return
+        except OSError:
+            pass
+        path.write_bytes(data)
 
     def _patch_document_frontmatter(self, record: BaseModel) -> None:
         for stem in RECORD_DOCUMENTS.get(type(record), set()):
             path = self.data_dir / record.path / f"{stem}.md"  # type: ignore[union-attr]
             if not path.exists():
                 continue
-            content = path.read_text()
+            content = path.read_text(encoding="utf-8")
             if not content.startswith("---\n"):
                 continue
             end = content.find("\n---\n", 4)
@@ -880,10 +887,10 @@ class FileSystemRepository:
             body = content[end + 5 :]
             existing.update(record.model_dump(mode="json"))
             new_fm = f"---\n{yaml.dump(existing, default_flow_style=False, allow_unicode=True, sort_keys=False)}---\n"
-            path.write_text(new_fm + body)
+            path.write_text(new_fm + body, encoding="utf-8")
 
     def load_document(self, uri: str) -> str:
-        return self._resolve_path(uri).read_text()
+        return self._resolve_path(uri).read_text(encoding="utf-8")
 
     def document_exists(self, uri: str) -> bool:
         return self._resolve_path(uri).exists()
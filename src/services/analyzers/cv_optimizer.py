@@ -38,12 +38,11 @@ class OutputLoader:
         optimized_cv = None
         artifacts: dict[str, BaseModel] = {}
 
-        for json_file in output_dir.glob("*.json"):
-            stem = json_file.stem
-            model_class = _OUTPUT_TYPES.get(stem)
-            if model_class is None:
+        for stem, model_class in _OUTPUT_TYPES.items():
+            try:
+                data = json.loads((output_dir / f"{stem}.json").read_text())
+            except FileNotFoundError:
                 continue
-            data = json.loads(json_file.read_text())
             obj = model_class(**data)
             if stem == "cv" and isinstance(obj, CurriculumVitae):
                 optimized_cv = obj
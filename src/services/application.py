@@ -35,6 +35,7 @@ class ApplicationService:
     def __init__(
         self,
         repository: Optional[FileSystemRepository] = None,
+        markdown_converter: Optional[MarkdownConverter] = None,
     ):
         self.job_posting_analyzer = JobPostingAnalyzer()
         self.cv_analyzer = CvAnalyzer()
@@ -45,7 +46,7 @@ class ApplicationService:
                 data_dir=settings.repositories.filesystem.data_dir
             )
         self.repository = repository
-        self.markdown_converter = MarkdownConverter()
+        self.markdown_converter = markdown_converter or MarkdownConverter()
         self.markdown_exporter = MarkdownExporter(
             self.repository, self.markdown_converter
         )
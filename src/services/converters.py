@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -13,22 +14,28 @@ def insert_json_as_frontmatter(data: dict, markdown: str) -> str:
     return f"---\n{yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)}---\n{markdown}"
 
 URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_WORD_BOUNDARY = re.compile("(.)([A-Z][a-z]+)")
+_CASE_BOUNDARY = re.compile("([a-z0-9])([A-Z])")
 
 _TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates" / "markdown"
 
 
+@lru_cache(maxsize=None)
 def _to_kebab_case(name: str) -> str:
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1-\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1-\2", s1).lower()
+    s1 = _WORD_BOUNDARY.sub(r"\1-\2", name)
+    return _CASE_BOUNDARY.sub(r"\1-\2", s1).lower()
 
 
-def _linkify(text: str) -> str:
-    def replace(match):
-        url = match.group(0)
-        display = url if len(url) < 60 else url[:57] + "..."
-        return f"[{display}]({url})"
+def _link_markup(match: re.Match) -> str:
+    url = match.group(0)
+    display = url if len(url) < 60 else url[:57] + "..."
+    return f"[{display}]({url})"
+
 
-    return URL_PATTERN.sub(replace, text)
+def _linkify(text: str) -> str:
+    if "://" not in text:
+        return text
+    return URL_PATTERN.sub(_link_markup, text)
 
 
 class MarkdownConverter:
@@ -41,6 +48,7 @@ class MarkdownConverter:
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True,
+            auto_reload=False,
         )
         self._env.filters["linkify"] = _linkify
 
@@ -1,5 +1,4 @@
-import re
-from typing import Optional
+from typing import Optional, TypeVar
 
 from pydantic import BaseModel
 
@@ -11,12 +10,9 @@ from models import (
     CurriculumVitaeRecord,
     OptimizedCvRecord,
 )
-from .converters import MarkdownConverter
+from .converters import MarkdownConverter, _to_kebab_case
 
-
-def _to_kebab_case(name: str) -> str:
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1-\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1-\2", s1).lower()
+T = TypeVar("T", bound=BaseModel)
 
 
 class MarkdownExporter:
@@ -33,6 +29,12 @@ class MarkdownExporter:
         uri = f"{base_uri}/{_to_kebab_case(type(obj).__name__)}.md"
         self.repository.save_document(uri, markdown)
 
+    def _load_required(self, base_uri: str, model_class: type[T]) -> T:
+        obj = self.repository.load_object(base_uri, model_class)
+        if obj is None:
+            raise FileNotFoundError(f"Missing {model_class.__name__} data at {base_uri}")
+        return obj
+
     def export_job_posting(self, record: JobPostingRecord, job_posting: JobPosting):
         self._save(f"job-postings/{record.identifier}", job_posting)
 
@@ -62,13 +64,13 @@ class MarkdownExporter:
         if collection_name is None or collection_name == "job-postings":
             for item in self.repository.list_job_postings(all=True):
                 record = JobPostingRecord(**item)
-                job_posting = self.repository.get_job_posting(record.identifier)
+                job_posting = self._load_required(record.path, JobPosting)
                 self.export_job_posting(record, job_posting)
                 count += 1
         if collection_name is None or collection_name == "cvs":
             for item in self.repository.list_cvs():
                 record = CurriculumVitaeRecord(**item)
-                cv = self.repository.get_cv(record.identifier)
+                cv = self._load_required(record.path, CurriculumVitae)
                 self.export_cv(record, cv)
                 count += 1
         if collection_name is None or collection_name == "optimizations":
@@ -78,15 +80,17 @@ class MarkdownExporter:
                 actual_path = self.repository.optimized_cv_base_uri(
                     record.job_posting_identifier, record.identifier
                 )
-                cv = self.repository.get_optimized_cv(
-                    record.job_posting_identifier, record.identifier
-                )
+                objects = self.repository.load_all_objects(actual_path)
+                cv = objects.pop("curriculum-vitae", None)
+                if cv is None:
+                    # untagged curriculum-vitae.json is skipped by load_all_objects
+                    cv = self.repository.load_object(actual_path, CurriculumVitae)
                 if cv:
                     self.export_cv(record, cv)
                     count += 1
-                for obj in self.repository.load_all_objects(actual_path).values():
+                for obj in objects.values():
                     if isinstance(obj, CurriculumVitae):
-                        continue  # already exported via export_cv
+                        continue  # only curriculum-vitae.json backs the CV markdown
                     self._save(uri, obj)
                     count += 1
         return count
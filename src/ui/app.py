@@ -13,7 +13,7 @@ from ui.components import front_matter_to_code_block
 from models import JobPosting, CurriculumVitae, CvTransformationPlan
 from services import ApplicationService
 from services import KnowledgeChatService
-from config.root import get_settings
+from config.root import get_settings, is_mcp_configured
 
 _UPLOADS_DIR = Path(__file__).parent.parent.parent / "uploads"
 
@@ -24,7 +24,7 @@ def create_app():
     service = ApplicationService()
     settings = get_settings()
     chat_config = settings.chat
-    mcp_available = settings.mcpServers.get("rag-knowledge") is not None
+    mcp_available = is_mcp_configured("rag-knowledge")
     chat_service = KnowledgeChatService() if mcp_available else None
 
     custom_css = """
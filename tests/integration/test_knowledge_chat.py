@@ -1,9 +1,17 @@
 import pytest
-from config.root import get_settings
+from functools import lru_cache
+from config.root import is_mcp_configured
 
 
 def _rag_configured() -> bool:
-    return get_settings().mcpServers.get("rag-knowledge") is not None
+    return is_mcp_configured("rag-knowledge")
+
+
+@lru_cache(maxsize=None)
+def _knowledge_chat_service():
+    from services.knowledge_chat import KnowledgeChatService
+
+    return KnowledgeChatService
 
 
 @pytest.mark.slow
@@ -13,9 +21,7 @@ def test_knowledge_chat_service_instantiates():
     if not _rag_configured():
         pytest.skip("MCP server 'rag-knowledge' not configured")
 
-    from services.knowledge_chat import KnowledgeChatService
-
-    service = KnowledgeChatService()
+    service = _knowledge_chat_service()()
     assert service is not None
 
 
@@ -23,13 +29,11 @@ def test_knowledge_chat_service_instantiates():
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_fetch_context_returns_documents():
-    """Test that fetch_context returns Documents with expected structure."""
+    """Test that fetch_context returns Documents and reuses one session across queries."""
     if not _rag_configured():
         pytest.skip("MCP server 'rag-knowledge' not configured")
 
-    from services.knowledge_chat import KnowledgeChatService
-
-    async with KnowledgeChatService() as service:
+    async with _knowledge_chat_service()() as service:
         docs = await service.fetch_context("Python experience", top_k=2)
 
         assert isinstance(docs, list)
@@ -43,20 +47,8 @@ async def test_fetch_context_returns_documents():
             assert "source" in doc.metadata
             assert "score" in doc.metadata
 
-
-@pytest.mark.slow
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_multiple_queries_work():
-    """Test that multiple queries can be made in sequence."""
-    if not _rag_configured():
-        pytest.skip("MCP server 'rag-knowledge' not configured")
-
-    from services.knowledge_chat import KnowledgeChatService
-
-    async with KnowledgeChatService() as service:
-        docs1 = await service.fetch_context("test query 1", top_k=1)
-        assert len(docs1) > 0
+        session = await service._manager.get_session()
 
         docs2 = await service.fetch_context("test query 2", top_k=1)
         assert len(docs2) > 0
+        assert await service._manager.get_session() is session
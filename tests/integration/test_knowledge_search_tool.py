@@ -24,29 +24,15 @@ def test_knowledge_search_tool_instantiates():
 
 @pytest.mark.slow
 @pytest.mark.integration
-def test_knowledge_search_tool_returns_results():
-    """Test that KnowledgeSearchTool returns search results."""
+def test_knowledge_search_tool_returns_json_results():
+    """Test that search results are valid JSON with expected structure."""
     tool = _make_tool()
     try:
         result = tool._run("Python experience")
     finally:
         tool.close()
 
-    assert result is not None
     assert isinstance(result, str)
-    assert len(result) > 0
-
-
-@pytest.mark.slow
-@pytest.mark.integration
-def test_knowledge_search_tool_result_is_json():
-    """Test that search results are valid JSON with expected structure."""
-    tool = _make_tool()
-    try:
-        result = tool._run("software development experience")
-    finally:
-        tool.close()
-
     data = json.loads(result)
     assert "results" in data
     assert isinstance(data["results"], list)
@@ -0,0 +1,76 @@
+"""
+Shared fixtures for unit tests.
+
+Sample models are session-scoped: tests must not mutate these; use
+model_copy(update=...) instead.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from models import Contact, CurriculumVitae, CvTransformationPlan, JobPosting
+
+
+@pytest.fixture(scope="session")
+def sample_contact():
+    return Contact(
+        city="San Francisco",
+        state="CA",
+        email="jane@example.com",
+        phone="555-1234",
+        linkedin="linkedin.com/in/janedoe",
+        github="github.com/janedoe",
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_job_posting():
+    return JobPosting(
+        url="https://example.com/job/123",
+        company="Acme Corp",
+        title="Software Engineer",
+        industry="Technology",
+        description="Build great software",
+        experience_level="Mid-level",
+        responsibilities=["Write code", "Review PRs"],
+        technical_skills=["Python", "Testing"],
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_cv(sample_contact):
+    return CurriculumVitae(
+        name="Jane Doe",
+        profession="Software Engineer",
+        contact=sample_contact,
+        core_expertise=["Python", "Testing"],
+        qualifications=["10 years experience"],
+        education=[],
+        experience=[],
+        additional_experience=[],
+        areas_of_expertise=[],
+        languages=[],
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_plan():
+    return CvTransformationPlan(
+        job_title="Staff Engineer",
+        company="Globex",
+        matching_skills=["Python", "system design"],
+        missing_skills=["Rust"],
+        profession_update="Staff Software Engineer",
+    )
+
+
+@pytest.fixture
+def data_path(temp_data_dir):
+    """Build paths under the test module's temp_data_dir."""
+    root = Path(temp_data_dir)
+
+    def _path(*parts):
+        return root.joinpath(*parts)
+
+    return _path
@@ -3,30 +3,41 @@ Unit tests for application service markdown generation.
 """
 
 import json
+import re
 import shutil
 import pytest
-import tempfile
-from pathlib import Path
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 from repositories import FileSystemRepository
 from services import ApplicationService
+from services.converters import MarkdownConverter
 from models import JobPosting, CurriculumVitae, Contact, CvTransformationPlan
 
+UNKNOWN_COLLECTION = re.compile("Unknown collection: invalid")
+NOT_FOUND = re.compile("not found")
+ALREADY_EXISTS = re.compile("already exists")
+
 
 @pytest.fixture
-def temp_data_dir():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+def temp_data_dir(tmp_path):
+    return str(tmp_path / "data")
+
+
+@pytest.fixture(scope="module")
+def markdown_converter():
+    return MarkdownConverter()
 
 
 @pytest.fixture
-def service(temp_data_dir):
+def service(temp_data_dir, markdown_converter):
     repository = FileSystemRepository(data_dir=temp_data_dir)
-    return ApplicationService(repository=repository)
+    return ApplicationService(
+        repository=repository, markdown_converter=markdown_converter
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_job_posting_data():
     return JobPosting(
         url="https://example.com/job/123",
@@ -40,7 +51,7 @@ def sample_job_posting_data():
     ).model_dump()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_cv_data():
     return CurriculumVitae(
         name="Jane Doe",
@@ -80,14 +91,16 @@ def test_generate_pdf_file_renders_data_to_explicit_output(service, sample_cv_da
 
 
 class TestSaveJobPostingMarkdown:
-    def test_creates_markdown(self, service, sample_job_posting_data, temp_data_dir):
+    @pytest.mark.content
+    def test_creates_markdown(self, service, sample_job_posting_data, data_path):
         service.save_job_posting(sample_job_posting_data, "test-job")
-        md_path = Path(temp_data_dir) / "job-postings" / "test-job" / "job-posting.md"
+        md_path = data_path("job-postings", "test-job", "job-posting.md")
         assert md_path.exists()
         content = md_path.read_text()
         assert "Software Engineer at Acme Corp" in content
 
-    def test_not_specified_company_omitted_from_title(self, service, temp_data_dir):
+    @pytest.mark.content
+    def test_not_specified_company_omitted_from_title(self, service, data_path):
         data = JobPosting(
             url="https://example.com/job/456",
             company="Not specified",
@@ -98,56 +111,62 @@ class TestSaveJobPostingMarkdown:
         ).model_dump()
 
         service.save_job_posting(data, "no-company")
-        md_path = Path(temp_data_dir) / "job-postings" / "no-company" / "job-posting.md"
+        md_path = data_path("job-postings", "no-company", "job-posting.md")
         content = md_path.read_text()
         assert "# Developer\n" in content
         assert "at Not specified" not in content
 
 
 class TestSaveCvMarkdown:
-    def test_creates_markdown(self, service, sample_cv_data, temp_data_dir):
+    @pytest.mark.content
+    def test_creates_markdown(self, service, sample_cv_data, data_path):
         service.save_cv(sample_cv_data, "test-cv")
-        md_path = Path(temp_data_dir) / "cvs" / "test-cv" / "curriculum-vitae.md"
+        md_path = data_path("cvs", "test-cv", "curriculum-vitae.md")
         assert md_path.exists()
         content = md_path.read_text()
         assert "# Jane Doe" in content
 
 
 class TestExportMarkdown:
-    def test_export_all(
-        self, service, sample_job_posting_data, sample_cv_data, temp_data_dir
+    @pytest.fixture
+    def missing_markdown(
+        self, service, sample_job_posting_data, sample_cv_data, data_path
     ):
         service.save_job_posting(sample_job_posting_data, "job-1")
         service.save_cv(sample_cv_data, "cv-1")
 
-        job_md = Path(temp_data_dir) / "job-postings" / "job-1" / "job-posting.md"
-        cv_md = Path(temp_data_dir) / "cvs" / "cv-1" / "curriculum-vitae.md"
+        job_md = data_path("job-postings", "job-1", "job-posting.md")
+        cv_md = data_path("cvs", "cv-1", "curriculum-vitae.md")
         job_md.unlink()
         cv_md.unlink()
+        return job_md, cv_md
+
+    @pytest.mark.parametrize(
+        "collection_name,expected_count,expect_cv_md",
+        [(None, 2, True), ("job-postings", 1, False)],
+        ids=["all", "by-collection"],
+    )
+    def test_export_regenerates_markdown(
+        self, service, missing_markdown, collection_name, expected_count, expect_cv_md
+    ):
+        job_md, cv_md = missing_markdown
 
-        count = service.export_markdown()
-        assert count == 2
+        count = service.export_markdown(collection_name=collection_name)
+        assert count == expected_count
         assert job_md.exists()
-        assert cv_md.exists()
+        assert cv_md.exists() is expect_cv_md
 
-    def test_export_by_collection(
-        self, service, sample_job_posting_data, sample_cv_data, temp_data_dir
+    def test_export_raises_when_record_data_missing(
+        self, service, sample_job_posting_data, data_path
     ):
         service.save_job_posting(sample_job_posting_data, "job-1")
-        service.save_cv(sample_cv_data, "cv-1")
-
-        job_md = Path(temp_data_dir) / "job-postings" / "job-1" / "job-posting.md"
-        cv_md = Path(temp_data_dir) / "cvs" / "cv-1" / "curriculum-vitae.md"
-        job_md.unlink()
-        cv_md.unlink()
+        data_path("job-postings", "job-1", "job-posting.json").unlink()
 
-        count = service.export_markdown(collection_name="job-postings")
-        assert count == 1
-        assert job_md.exists()
-        assert not cv_md.exists()
+        with pytest.raises(FileNotFoundError):
+            service.export_markdown(collection_name="job-postings")
 
     def test_export_optimizations(
-        self, service, sample_job_posting_data, sample_cv_data, temp_data_dir
+        self, service, sample_job_posting_data, sample_cv_data, data_path
     ):
         service.save_job_posting(sample_job_posting_data, "job-1")
         service.save_cv(sample_cv_data, "cv-1")
@@ -158,7 +177,7 @@ class TestExportMarkdown:
         service.repository.add_optimized_cv("job-1", "opt-1", "cv-1", cv)
         service.repository.save_object(base_uri, plan)
 
-        opt_dir = Path(temp_data_dir) / "job-postings" / "job-1" / "cvs" / "opt-1"
+        opt_dir = data_path("job-postings", "job-1", "cvs", "opt-1")
         plan_md = opt_dir / "cv-transformation-plan.md"
         cv_md = opt_dir / "curriculum-vitae.md"
 
@@ -167,6 +186,21 @@ class TestExportMarkdown:
         assert plan_md.exists()
         assert cv_md.exists()
 
+    def test_export_optimizations_includes_untagged_cv(
+        self, service, sample_job_posting_data, sample_cv_data, data_path
+    ):
+        service.save_job_posting(sample_job_posting_data, "job-1")
+        cv = CurriculumVitae(**sample_cv_data)
+        service.repository.add_optimized_cv("job-1", "opt-1", "cv-1", cv)
+
+        opt_dir = data_path("job-postings", "job-1", "cvs", "opt-1")
+        (opt_dir / "curriculum-vitae.json").write_text(json.dumps(cv.model_dump(mode="json")))
+        (opt_dir / "curriculum-vitae.md").unlink(missing_ok=True)
+
+        count = service.export_markdown(collection_name="optimizations")
+        assert count == 1
+        assert (opt_dir / "curriculum-vitae.md").exists()
+
     def test_export_cvs_excludes_optimized(
         self, service, sample_job_posting_data, sample_cv_data
     ):
@@ -180,7 +214,7 @@ class TestExportMarkdown:
         assert count == 1
 
     def test_unknown_collection_raises(self, service):
-        with pytest.raises(ValueError, match="Unknown collection: invalid"):
+        with pytest.raises(ValueError, match=UNKNOWN_COLLECTION):
             service.export_markdown(collection_name="invalid")
 
 
@@ -197,9 +231,9 @@ class TestRemoveJobPosting:
         service.remove_job_posting("acme-swe")
         assert service.get_job_posting("acme-swe") is None
 
-    def test_deletes_markdown(self, service, sample_job_posting_data, temp_data_dir):
+    def test_deletes_markdown(self, service, sample_job_posting_data, data_path):
         service.save_job_posting(sample_job_posting_data, "acme-swe")
-        md_path = Path(temp_data_dir) / "job-postings" / "acme-swe" / "job-posting.md"
+        md_path = data_path("job-postings", "acme-swe", "job-posting.md")
         assert md_path.exists()
         service.remove_job_posting("acme-swe")
         assert not md_path.exists()
@@ -218,9 +252,9 @@ class TestRemoveCv:
         service.remove_cv("jane-doe")
         assert service.get_cv("jane-doe") is None
 
-    def test_deletes_markdown(self, service, sample_cv_data, temp_data_dir):
+    def test_deletes_markdown(self, service, sample_cv_data, data_path):
         service.save_cv(sample_cv_data, "jane-doe")
-        md_path = Path(temp_data_dir) / "cvs" / "jane-doe" / "curriculum-vitae.md"
+        md_path = data_path("cvs", "jane-doe", "curriculum-vitae.md")
         assert md_path.exists()
         service.remove_cv("jane-doe")
         assert not md_path.exists()
@@ -228,13 +262,13 @@ class TestRemoveCv:
 
 class TestRenameJobPosting:
     def test_raises_when_not_found(self, service):
-        with pytest.raises(ValueError, match="not found"):
+        with pytest.raises(ValueError, match=NOT_FOUND):
             service.rename_job_posting("nonexistent", "new-id")
 
     def test_raises_on_collision(self, service, sample_job_posting_data):
         service.save_job_posting(sample_job_posting_data, "job-1")
         service.save_job_posting(sample_job_posting_data, "job-2")
-        with pytest.raises(ValueError, match="already exists"):
+        with pytest.raises(ValueError, match=ALREADY_EXISTS):
             service.rename_job_posting("job-1", "job-2")
 
     def test_data_accessible_at_new_identifier(self, service, sample_job_posting_data):
@@ -243,22 +277,22 @@ class TestRenameJobPosting:
         assert service.get_job_posting("old-id") is None
         assert service.get_job_posting("new-id") is not None
 
-    def test_moves_markdown(self, service, sample_job_posting_data, temp_data_dir):
+    def test_moves_markdown(self, service, sample_job_posting_data, data_path):
         service.save_job_posting(sample_job_posting_data, "old-id")
         service.rename_job_posting("old-id", "new-id")
-        assert not (Path(temp_data_dir) / "job-postings" / "old-id").exists()
-        assert (Path(temp_data_dir) / "job-postings" / "new-id" / "job-posting.md").exists()
+        assert not data_path("job-postings", "old-id").exists()
+        assert data_path("job-postings", "new-id", "job-posting.md").exists()
 
 
 class TestRenameCv:
     def test_raises_when_not_found(self, service):
-        with pytest.raises(ValueError, match="not found"):
+        with pytest.raises(ValueError, match=NOT_FOUND):
             service.rename_cv("nonexistent", "new-id")
 
     def test_raises_on_collision(self, service, sample_cv_data):
         service.save_cv(sample_cv_data, "cv-1")
         service.save_cv(sample_cv_data, "cv-2")
-        with pytest.raises(ValueError, match="already exists"):
+        with pytest.raises(ValueError, match=ALREADY_EXISTS):
             service.rename_cv("cv-1", "cv-2")
 
     def test_data_accessible_at_new_identifier(self, service, sample_cv_data):
@@ -267,11 +301,11 @@ class TestRenameCv:
         assert service.get_cv("old-id") is None
         assert service.get_cv("new-id") is not None
 
-    def test_moves_markdown(self, service, sample_cv_data, temp_data_dir):
+    def test_moves_markdown(self, service, sample_cv_data, data_path):
         service.save_cv(sample_cv_data, "old-id")
         service.rename_cv("old-id", "new-id")
-        assert not (Path(temp_data_dir) / "cvs" / "old-id").exists()
-        assert (Path(temp_data_dir) / "cvs" / "new-id" / "curriculum-vitae.md").exists()
+        assert not data_path("cvs", "old-id").exists()
+        assert data_path("cvs", "new-id", "curriculum-vitae.md").exists()
 
     def test_repairs_optimization_references(
         self, service, sample_job_posting_data, sample_cv_data
@@ -326,7 +360,6 @@ class TestMarkApplied:
         mock_repo.mark_applied.assert_called_once_with("acme-swe", "my-cv", applied_at=None)
 
     def test_forwards_applied_at(self):
-        from datetime import datetime
         mock_repo = MagicMock()
         service = ApplicationService(repository=mock_repo)
         service.markdown_exporter = MagicMock()
@@ -411,11 +444,16 @@ def _move_job_posting(repository, identifier, new_rel):
     repository._save_collection(repository.job_postings_collection, collection)
 
 
+def _write_plan_file(cv_dir, plan):
+    data = {**plan.model_dump(mode="json"), "_type": "CvTransformationPlan"}
+    (cv_dir / "cv-transformation-plan.json").write_text(json.dumps(data))
+
+
 class TestSaveCvOptimizationUsesParentPath:
     """save_cv_optimization must write to the parent's stored path and export markdown."""
 
     def test_saves_to_parent_stored_path(
-        self, service, sample_job_posting_data, sample_cv_data, temp_data_dir
+        self, service, sample_job_posting_data, sample_cv_data
     ):
         service.save_job_posting(sample_job_posting_data, "acme-swe")
         _move_job_posting(service.repository, "acme-swe", "job-postings/archived/acme-swe")
@@ -433,7 +471,7 @@ class TestExportOptimizationsUsesParentPath:
     """export('optimizations') must load artifacts and write markdown via the parent's stored path."""
 
     def test_finds_artifacts_after_parent_path_moved(
-        self, service, sample_job_posting_data, sample_cv_data, temp_data_dir
+        self, service, sample_job_posting_data, sample_cv_data, data_path
     ):
         service.save_job_posting(sample_job_posting_data, "acme-swe")
         cv = CurriculumVitae(**sample_cv_data)
@@ -441,10 +479,8 @@ class TestExportOptimizationsUsesParentPath:
 
         service.repository.add_optimized_cv("acme-swe", "opt-1", "jane-doe", cv)
 
-        cv_dir = Path(temp_data_dir) / "job-postings/acme-swe/cvs/opt-1"
-        plan_data = plan.model_dump(mode="json")
-        plan_data["_type"] = "CvTransformationPlan"
-        (cv_dir / "cv-transformation-plan.json").write_text(json.dumps(plan_data))
+        cv_dir = data_path("job-postings", "acme-swe", "cvs", "opt-1")
+        _write_plan_file(cv_dir, plan)
 
         # Moving the parent carries the nested cvs/ subdir with it.
         _move_job_posting(service.repository, "acme-swe", "job-postings/archived/acme-swe")
@@ -455,7 +491,7 @@ class TestExportOptimizationsUsesParentPath:
         assert count == 2
 
     def test_markdown_written_at_parent_stored_path(
-        self, service, sample_job_posting_data, sample_cv_data, temp_data_dir
+        self, service, sample_job_posting_data, sample_cv_data, data_path
     ):
         service.save_job_posting(sample_job_posting_data, "acme-swe")
         cv = CurriculumVitae(**sample_cv_data)
@@ -465,7 +501,7 @@ class TestExportOptimizationsUsesParentPath:
 
         service.export_markdown(collection_name="optimizations")
 
-        cv_md = Path(temp_data_dir) / "job-postings/archived/acme-swe/cvs/opt-1/curriculum-vitae.md"
+        cv_md = data_path("job-postings", "archived", "acme-swe", "cvs", "opt-1", "curriculum-vitae.md")
         assert cv_md.exists()
 
 
@@ -473,7 +509,7 @@ class TestGetCvOptimizationUsesParentPath:
     """get_cv_optimization must load the transformation plan from the parent's stored path."""
 
     def test_finds_plan_at_parent_stored_path(
-        self, service, sample_job_posting_data, sample_cv_data, temp_data_dir
+        self, service, sample_job_posting_data, sample_cv_data, data_path
     ):
         service.save_job_posting(sample_job_posting_data, "acme-swe")
         _move_job_posting(service.repository, "acme-swe", "job-postings/archived/acme-swe")
@@ -483,10 +519,8 @@ class TestGetCvOptimizationUsesParentPath:
 
         service.repository.add_optimized_cv("acme-swe", "opt-1", "jane-doe", cv)
 
-        cv_dir = Path(temp_data_dir) / "job-postings/archived/acme-swe/cvs/opt-1"
-        plan_json = plan.model_dump(mode="json")
-        plan_json["_type"] = "CvTransformationPlan"
-        (cv_dir / "cv-transformation-plan.json").write_text(json.dumps(plan_json))
+        cv_dir = data_path("job-postings", "archived", "acme-swe", "cvs", "opt-1")
+        _write_plan_file(cv_dir, plan)
 
         plan_data, _ = service.get_cv_optimization("acme-swe", "opt-1")
 
@@ -556,12 +590,12 @@ class TestAddDocument:
         doc_uri = service.add_document("job-postings/acme-swe/intake.md", str(source))
         assert doc_uri == "job-postings/acme-swe/intake.md"
 
-    def test_content_written_to_directory(self, service, sample_job_posting_data, tmp_path, temp_data_dir):
+    def test_content_written_to_directory(self, service, sample_job_posting_data, tmp_path, data_path):
         service.save_job_posting(sample_job_posting_data, "acme-swe")
         source = tmp_path / "notes.md"
         source.write_text("# Notes")
         service.add_document("job-postings/acme-swe", str(source))
-        dest = Path(temp_data_dir) / "job-postings" / "acme-swe" / "notes.md"
+        dest = data_path("job-postings", "acme-swe", "notes.md")
         assert dest.exists()
         assert dest.read_text() == "# Notes"
 
@@ -5,7 +5,6 @@ Unit tests for configuration loading.
 import pytest
 from pathlib import Path
 from unittest.mock import patch
-import tempfile
 
 from config.settings import (
     deep_merge,
@@ -14,7 +13,13 @@ from config.settings import (
     AgentSettings,
     CrewSettings,
 )
-from config.root import _load_merged_config, get_merged_config, get_settings, RootSettings
+from config.root import (
+    _load_merged_config,
+    get_merged_config,
+    get_settings,
+    is_mcp_configured,
+    RootSettings,
+)
 from repositories.config.settings import RepositoriesSettings, FilesystemRepositorySettings
 
 
@@ -51,6 +56,11 @@ class TestExpandTildes:
         assert not result["path"].startswith("~")
         assert result["path"].endswith("/some/path")
 
+    def test_normalizes_expanded_path(self):
+        config = {"path": "~/cv-data//nested/"}
+        result = expand_tildes(config)
+        assert result["path"].endswith("/cv-data/nested")
+
     def test_expands_tilde_in_nested_dict(self):
         config = {"outer": {"inner": "~/nested/path"}}
         result = expand_tildes(config)
@@ -73,6 +83,18 @@ class TestExpandTildes:
         result = expand_tildes(config)
         assert result["value"] == "~"
 
+    def test_expands_tilde_in_list_inside_list(self):
+        config = {"args": [["~/bin/server", "--flag"]]}
+        result = expand_tildes(config)
+        assert not result["args"][0][0].startswith("~")
+        assert result["args"][0][0].endswith("/bin/server")
+        assert result["args"][0][1] == "--flag"
+
+    def test_expands_in_place(self):
+        config = {"path": "~/some/path"}
+        result = expand_tildes(config)
+        assert result is config
+
 
 class TestMcpServerSettings:
     def test_validates_from_yaml_alias(self):
@@ -99,114 +121,127 @@ class TestRootConfigPipeline:
     def teardown_method(self):
         _load_merged_config.cache_clear()
 
-    def test_assembles_namespaced_defaults_and_overrides(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp = Path(tmpdir)
-            config_dir = tmp / "config"
-            crews_dir = tmp / "crews"
-            repo_dir = tmp / "repositories"
+    def test_assembles_namespaced_defaults_and_overrides(self, tmp_path):
+        config_dir = tmp_path / "config"
+        crews_dir = tmp_path / "crews"
+        repo_dir = tmp_path / "repositories"
 
-            config_dir.mkdir()
-            (crews_dir / "cv_analysis" / "config").mkdir(parents=True)
-            (repo_dir / "config").mkdir(parents=True)
+        config_dir.mkdir()
+        (crews_dir / "cv_analysis" / "config").mkdir(parents=True)
+        (repo_dir / "config").mkdir(parents=True)
 
-            (config_dir / "settings.yaml").write_text(
-                "chat:\n  model: default-chat\nmcpServers:\n  rag-knowledge: null\n"
-            )
-            (crews_dir / "cv_analysis" / "config" / "settings.yaml").write_text(
-                "agents:\n  cv_analyst:\n    model: default-crew\n"
-            )
-            (repo_dir / "config" / "settings.yaml").write_text(
-                "filesystem:\n  data_dir: ./data\n"
-            )
+        (config_dir / "settings.yaml").write_text(
+            "chat:\n  model: default-chat\nmcpServers:\n  rag-knowledge: null\n"
+        )
+        (crews_dir / "cv_analysis" / "config" / "settings.yaml").write_text(
+            "agents:\n  cv_analyst:\n    model: default-crew\n"
+        )
+        (repo_dir / "config" / "settings.yaml").write_text(
+            "filesystem:\n  data_dir: ./data\n"
+        )
 
-            user_config_file = tmp / "user_settings.yaml"
-            user_config_file.write_text(
-                "\n".join(
-                    [
-                        "chat:",
-                        "  model: user-chat",
-                        "mcpServers:",
-                        "  rag-knowledge:",
-                        "    command: uvx",
-                        "    args: [rag-server]",
-                        "    x-tool-name: rag_search",
-                        "crews:",
-                        "  cv_analysis:",
-                        "    agents:",
-                        "      cv_analyst:",
-                        "        model: user-crew",
-                        "repositories:",
-                        "  filesystem:",
-                        "    data_dir: ~/cv-data",
-                    ]
-                )
-                + "\n"
+        user_config_file = tmp_path / "user_settings.yaml"
+        user_config_file.write_text(
+            "\n".join(
+                [
+                    "chat:",
+                    "  model: user-chat",
+                    "mcpServers:",
+                    "  rag-knowledge:",
+                    "    command: uvx",
+                    "    args: [rag-server]",
+                    "    x-tool-name: rag_search",
+                    "crews:",
+                    "  cv_analysis:",
+                    "    agents:",
+                    "      cv_analyst:",
+                    "        model: user-crew",
+                    "repositories:",
+                    "  filesystem:",
+                    "    data_dir: ~/cv-data",
+                ]
             )
+            + "\n"
+        )
 
-            (crews_dir / "cv_analysis" / "config" / "settings.local.yaml").write_text(
-                "agents:\n  cv_analyst:\n    model: local-crew\n"
-            )
-            (repo_dir / "config" / "settings.local.yaml").write_text(
-                "filesystem:\n  data_dir: ./local-data\n"
-            )
+        (crews_dir / "cv_analysis" / "config" / "settings.local.yaml").write_text(
+            "agents:\n  cv_analyst:\n    model: local-crew\n"
+        )
+        (repo_dir / "config" / "settings.local.yaml").write_text(
+            "filesystem:\n  data_dir: ./local-data\n"
+        )
 
-            with patch("config.root.CONFIG_DIR", config_dir), patch(
-                "config.root.CREWS_DIR", crews_dir
-            ), patch("config.root.REPOSITORIES_DIR", repo_dir), patch(
-                "config.settings.USER_CONFIG_FILE", user_config_file
-            ), patch(
-                "config.root.load_dotenv"
-            ) as load_dotenv_mock:
-                _load_merged_config.cache_clear()
-                config = get_merged_config()
-
-            assert config["chat"]["model"] == "user-chat"
-            assert config["mcpServers"]["rag-knowledge"]["x-tool-name"] == "rag_search"
-            assert (
-                config["crews"]["cv_analysis"]["agents"]["cv_analyst"]["model"]
-                == "local-crew"
-            )
-            assert config["repositories"]["filesystem"]["data_dir"] == "./local-data"
-            load_dotenv_mock.assert_called_once_with()
-
-    def test_raises_if_root_settings_yaml_missing(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp = Path(tmpdir)
-            empty_config_dir = tmp / "config"
-            empty_config_dir.mkdir()
-            with patch("config.root.CONFIG_DIR", empty_config_dir), patch(
-                "config.root.CREWS_DIR", tmp / "crews"
-            ), patch("config.root.REPOSITORIES_DIR", tmp / "repositories"), patch(
-                "config.root.load_dotenv"
-            ):
-                _load_merged_config.cache_clear()
-                with pytest.raises(FileNotFoundError):
-                    get_merged_config()
-
-    def test_returns_defensive_copy_from_cached_loader(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp = Path(tmpdir)
-            config_dir = tmp / "config"
-            config_dir.mkdir()
-            (config_dir / "settings.yaml").write_text(
-                "chat:\n  model: default-chat\nmcpServers:\n  rag-knowledge: null\n"
-            )
-            user_config_file = tmp / "missing-user-settings.yaml"
+        with patch("config.root.CONFIG_DIR", config_dir), patch(
+            "config.root.CREWS_DIR", crews_dir
+        ), patch("config.root.REPOSITORIES_DIR", repo_dir), patch(
+            "config.settings.USER_CONFIG_FILE", user_config_file
+        ), patch(
+            "config.root.load_dotenv"
+        ) as load_dotenv_mock:
+            _load_merged_config.cache_clear()
+            config = get_merged_config()
+
+        assert config["chat"]["model"] == "user-chat"
+        assert config["mcpServers"]["rag-knowledge"]["x-tool-name"] == "rag_search"
+        assert (
+            config["crews"]["cv_analysis"]["agents"]["cv_analyst"]["model"]
+            == "local-crew"
+        )
+        assert config["repositories"]["filesystem"]["data_dir"] == "./local-data"
+        load_dotenv_mock.assert_called_once_with()
+
+    def test_raises_if_root_settings_yaml_missing(self, tmp_path):
+        empty_config_dir = tmp_path / "config"
+        empty_config_dir.mkdir()
+        with patch("config.root.CONFIG_DIR", empty_config_dir), patch(
+            "config.root.CREWS_DIR", tmp_path / "crews"
+        ), patch("config.root.REPOSITORIES_DIR", tmp_path / "repositories"), patch(
+            "config.root.load_dotenv"
+        ):
+            _load_merged_config.cache_clear()
+            with pytest.raises(FileNotFoundError):
+                get_merged_config()
 
-            with patch("config.root.CONFIG_DIR", config_dir), patch(
-                "config.root.CREWS_DIR", tmp / "crews"
-            ), patch("config.root.REPOSITORIES_DIR", tmp / "repositories"), patch(
-                "config.settings.USER_CONFIG_FILE", user_config_file
-            ), patch(
-                "config.root.load_dotenv"
-            ):
-                _load_merged_config.cache_clear()
-                config = get_merged_config()
-                config["chat"]["model"] = "mutated"
-                refreshed = get_merged_config()
+    def test_returns_defensive_copy_from_cached_loader(self, tmp_path):
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (config_dir / "settings.yaml").write_text(
+            "chat:\n  model: default-chat\nmcpServers:\n  rag-knowledge: null\n"
+        )
+        user_config_file = tmp_path / "missing-user-settings.yaml"
 
-            assert refreshed["chat"]["model"] == "default-chat"
+        with patch("config.root.CONFIG_DIR", config_dir), patch(
+            "config.root.CREWS_DIR", tmp_path / "crews"
+        ), patch("config.root.REPOSITORIES_DIR", tmp_path / "repositories"), patch(
+            "config.settings.USER_CONFIG_FILE", user_config_file
+        ), patch(
+            "config.root.load_dotenv"
+        ):
+            _load_merged_config.cache_clear()
+            config = get_merged_config()
+            config["chat"]["model"] = "mutated"
+            refreshed = get_merged_config()
+
+        assert refreshed["chat"]["model"] == "default-chat"
+
+
+def _patch_config_dirs(tmp: Path, user_settings: str | None = None):
+    config_dir = tmp / "config"
+    config_dir.mkdir()
+    (config_dir / "settings.yaml").write_text(
+        "chat:\n  model: test-model\n  temperature: 0.5\n"
+        "mcpServers:\n  rag-knowledge: null\n"
+    )
+    user_config_file = tmp / "user_settings.yaml"
+    if user_settings is not None:
+        user_config_file.write_text(user_settings)
+    return patch("config.root.CONFIG_DIR", config_dir), patch(
+        "config.root.CREWS_DIR", tmp / "crews"
+    ), patch("config.root.REPOSITORIES_DIR", tmp / "repositories"), patch(
+        "config.settings.USER_CONFIG_FILE", user_config_file
+    ), patch(
+        "config.root.load_dotenv"
+    )
 
 
 class TestGetSettings:
@@ -216,86 +251,100 @@ class TestGetSettings:
     def teardown_method(self):
         _load_merged_config.cache_clear()
 
-    def _patch_dirs(self, tmp: Path):
-        config_dir = tmp / "config"
-        config_dir.mkdir()
-        (config_dir / "settings.yaml").write_text(
-            "chat:\n  model: test-model\n  temperature: 0.5\n"
-            "mcpServers:\n  rag-knowledge: null\n"
+    def test_returns_root_settings_instance(self, tmp_path):
+        repo_dir = tmp_path / "repositories"
+        (repo_dir / "config").mkdir(parents=True)
+        (repo_dir / "config" / "settings.yaml").write_text(
+            "filesystem:\n  data_dir: ./data\n"
         )
-        crews_dir = tmp / "crews"
-        repo_dir = tmp / "repositories"
-        return patch("config.root.CONFIG_DIR", config_dir), patch(
-            "config.root.CREWS_DIR", crews_dir
-        ), patch("config.root.REPOSITORIES_DIR", repo_dir), patch(
-            "config.settings.USER_CONFIG_FILE", tmp / "no-user-settings.yaml"
-        ), patch(
-            "config.root.load_dotenv"
-        )
-
-    def test_returns_root_settings_instance(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp = Path(tmpdir)
-            repo_dir = tmp / "repositories"
-            (repo_dir / "config").mkdir(parents=True)
-            (repo_dir / "config" / "settings.yaml").write_text(
-                "filesystem:\n  data_dir: ./data\n"
-            )
-            p1, p2, p3, p4, p5 = self._patch_dirs(tmp)
-            with p1, p2, p3, p4, p5:
-                settings = get_settings()
+        p1, p2, p3, p4, p5 = _patch_config_dirs(tmp_path)
+        with p1, p2, p3, p4, p5:
+            settings = get_settings()
         assert isinstance(settings, RootSettings)
         assert settings.chat.model == "test-model"
         assert settings.chat.temperature == 0.5
         assert settings.repositories.filesystem.data_dir == "./data"
 
-    def test_returns_fresh_object_each_call(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp = Path(tmpdir)
-            repo_dir = tmp / "repositories"
-            (repo_dir / "config").mkdir(parents=True)
-            (repo_dir / "config" / "settings.yaml").write_text(
-                "filesystem:\n  data_dir: ./data\n"
-            )
-            p1, p2, p3, p4, p5 = self._patch_dirs(tmp)
-            with p1, p2, p3, p4, p5:
-                s1 = get_settings()
-                s2 = get_settings()
+    def test_returns_fresh_object_each_call(self, tmp_path):
+        repo_dir = tmp_path / "repositories"
+        (repo_dir / "config").mkdir(parents=True)
+        (repo_dir / "config" / "settings.yaml").write_text(
+            "filesystem:\n  data_dir: ./data\n"
+        )
+        p1, p2, p3, p4, p5 = _patch_config_dirs(tmp_path)
+        with p1, p2, p3, p4, p5:
+            s1 = get_settings()
+            s2 = get_settings()
         assert s1 is not s2
         assert s1.chat.model == s2.chat.model
 
-    def test_mutation_does_not_affect_next_call(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp = Path(tmpdir)
-            repo_dir = tmp / "repositories"
-            (repo_dir / "config").mkdir(parents=True)
-            (repo_dir / "config" / "settings.yaml").write_text(
-                "filesystem:\n  data_dir: ./data\n"
-            )
-            p1, p2, p3, p4, p5 = self._patch_dirs(tmp)
-            with p1, p2, p3, p4, p5:
-                s1 = get_settings()
-                s1.chat.model = "mutated"
-                s2 = get_settings()
+    def test_mutation_does_not_affect_next_call(self, tmp_path):
+        repo_dir = tmp_path / "repositories"
+        (repo_dir / "config").mkdir(parents=True)
+        (repo_dir / "config" / "settings.yaml").write_text(
+            "filesystem:\n  data_dir: ./data\n"
+        )
+        p1, p2, p3, p4, p5 = _patch_config_dirs(tmp_path)
+        with p1, p2, p3, p4, p5:
+            s1 = get_settings()
+            s1.chat.model = "mutated"
+            s2 = get_settings()
         assert s2.chat.model == "test-model"
 
-    def test_raw_config_cache_clear_causes_reload(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp = Path(tmpdir)
-            repo_dir = tmp / "repositories"
-            (repo_dir / "config").mkdir(parents=True)
-            (repo_dir / "config" / "settings.yaml").write_text(
-                "filesystem:\n  data_dir: ./data\n"
-            )
-            p1, p2, p3, p4, p5 = self._patch_dirs(tmp)
-            with p1, p2, p3, p4, p5:
-                s1 = get_settings()
-                _load_merged_config.cache_clear()
-                s2 = get_settings()
+    def test_raw_config_cache_clear_causes_reload(self, tmp_path):
+        repo_dir = tmp_path / "repositories"
+        (repo_dir / "config").mkdir(parents=True)
+        (repo_dir / "config" / "settings.yaml").write_text(
+            "filesystem:\n  data_dir: ./data\n"
+        )
+        p1, p2, p3, p4, p5 = _patch_config_dirs(tmp_path)
+        with p1, p2, p3, p4, p5:
+            s1 = get_settings()
+            _load_merged_config.cache_clear()
+            s2 = get_settings()
         assert s1 is not s2
         assert s1.chat.model == s2.chat.model
 
 
+class TestIsMcpConfigured:
+    def setup_method(self):
+        _load_merged_config.cache_clear()
+
+    def teardown_method(self):
+        _load_merged_config.cache_clear()
+
+    def test_false_when_server_is_null(self, tmp_path):
+        p1, p2, p3, p4, p5 = _patch_config_dirs(tmp_path, "")
+        with p1, p2, p3, p4, p5:
+            assert is_mcp_configured("rag-knowledge") is False
+
+    def test_false_when_server_is_absent(self, tmp_path):
+        p1, p2, p3, p4, p5 = _patch_config_dirs(tmp_path, "")
+        with p1, p2, p3, p4, p5:
+            assert is_mcp_configured("nonexistent-server") is False
+
+    def test_true_when_user_configures_server(self, tmp_path):
+        p1, p2, p3, p4, p5 = _patch_config_dirs(
+            tmp_path,
+            "mcpServers:\n  rag-knowledge:\n    command: uvx\n"
+            "    x-tool-name: rag_search\n",
+        )
+        with p1, p2, p3, p4, p5:
+            assert is_mcp_configured("rag-knowledge") is True
+
+    def test_false_when_mcp_servers_is_null(self, tmp_path):
+        p1, p2, p3, p4, p5 = _patch_config_dirs(tmp_path, "mcpServers: null\n")
+        with p1, p2, p3, p4, p5:
+            assert is_mcp_configured("rag-knowledge") is False
+
+    def test_false_when_server_entry_is_invalid(self, tmp_path):
+        p1, p2, p3, p4, p5 = _patch_config_dirs(
+            tmp_path, "mcpServers:\n  rag-knowledge: {}\n"
+        )
+        with p1, p2, p3, p4, p5:
+            assert is_mcp_configured("rag-knowledge") is False
+
+
 class TestTypedConfigWrappers:
     def test_repository_config_uses_injected_settings(self):
         from repositories.config.settings import Config
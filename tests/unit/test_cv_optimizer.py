@@ -3,59 +3,13 @@ Unit tests for CvOptimizer facade.
 """
 
 import json
-import pytest
 from pathlib import Path
 
-from models import CurriculumVitae, CvTransformationPlan, Contact, JobPosting
+from models import CurriculumVitae, CvTransformationPlan
 from services.analyzers.cv_optimizer import CvOptimizer, FileBasedCvOptimizer
 from services.analyzers.models import OptimizerOutput
 
 
-@pytest.fixture
-def sample_cv():
-    return CurriculumVitae(
-        name="Jane Doe",
-        profession="Software Engineer",
-        contact=Contact(
-            city="San Francisco",
-            state="CA",
-            email="jane@example.com",
-            phone="555-1234",
-            linkedin="linkedin.com/in/janedoe",
-            github="github.com/janedoe",
-        ),
-        core_expertise=["Python"],
-        qualifications=["10 years experience"],
-        education=[],
-        experience=[],
-        additional_experience=[],
-        areas_of_expertise=[],
-        languages=[],
-    )
-
-
-@pytest.fixture
-def sample_job_posting():
-    return JobPosting(
-        url="https://example.com/job/123",
-        company="Acme Corp",
-        title="Software Engineer",
-        industry="Technology",
-        description="Build great software",
-        experience_level="Mid-level",
-    )
-
-
-@pytest.fixture
-def sample_plan():
-    return CvTransformationPlan(
-        job_title="Software Engineer",
-        company="Acme Corp",
-        matching_skills=["Python"],
-        missing_skills=[],
-    )
-
-
 def _fake_kickoff(inputs, cv, plan):
     """Simulates the crew writing output files to output_directory."""
     output_dir = Path(inputs["output_directory"])
@@ -1,6 +1,8 @@
 from types import SimpleNamespace
 from unittest.mock import Mock
 
+import pytest
+
 from config.settings import McpServerSettings
 from connectors import McpManager
 
@@ -36,3 +38,24 @@ def test_knowledge_chat_service_uses_root_settings(monkeypatch):
         temperature=0.3,
         model_name="test-chat-model",
     )
+
+
+def test_knowledge_chat_service_raises_for_unconfigured_server(monkeypatch):
+    from services import knowledge_chat
+
+    monkeypatch.setattr(knowledge_chat, "ChatOpenAI", Mock())
+    monkeypatch.setattr(
+        knowledge_chat,
+        "get_settings",
+        Mock(
+            return_value=SimpleNamespace(
+                chat=SimpleNamespace(model="test-chat-model", temperature=0.3),
+                mcpServers={"rag-knowledge": None},
+            )
+        ),
+    )
+
+    with pytest.raises(ValueError, match="not configured"):
+        knowledge_chat.KnowledgeChatService("nonexistent-server")
+
+    knowledge_chat.ChatOpenAI.assert_not_called()
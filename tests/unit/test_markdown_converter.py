@@ -1,17 +1,13 @@
 import pytest
+from pydantic import BaseModel
 
 from services.converters import MarkdownConverter, _linkify
-from models import (
-    JobPosting,
-    CurriculumVitae,
-    Contact,
-    CvTransformationPlan,
-)
+from models import JobPosting
 
 TEMPLATES_DIR = "templates/markdown"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def converter():
     return MarkdownConverter(templates_dir=TEMPLATES_DIR)
 
@@ -43,19 +39,6 @@ class TestLinkify:
 
 
 class TestConvertJobPosting:
-    @pytest.fixture
-    def sample_job_posting(self):
-        return JobPosting(
-            url="https://example.com/job/123",
-            company="Acme Corp",
-            title="Software Engineer",
-            industry="Technology",
-            description="Build great software",
-            experience_level="Mid-level",
-            responsibilities=["Write code", "Review PRs"],
-            technical_skills=["Python", "Testing"],
-        )
-
     def test_title_includes_company(self, converter, sample_job_posting):
         result = converter.convert_job_posting(sample_job_posting)
         assert "# Software Engineer at Acme Corp" in result
@@ -94,28 +77,6 @@ class TestConvertJobPosting:
 
 
 class TestConvertCv:
-    @pytest.fixture
-    def sample_cv(self):
-        return CurriculumVitae(
-            name="Jane Doe",
-            profession="Software Engineer",
-            contact=Contact(
-                city="San Francisco",
-                state="CA",
-                email="jane@example.com",
-                phone="555-1234",
-                linkedin="linkedin.com/in/janedoe",
-                github="github.com/janedoe",
-            ),
-            core_expertise=["Python", "Testing"],
-            qualifications=["10 years experience"],
-            education=[],
-            experience=[],
-            additional_experience=[],
-            areas_of_expertise=[],
-            languages=[],
-        )
-
     def test_title_is_name(self, converter, sample_cv):
         result = converter.convert_cv(sample_cv)
         assert "# Jane Doe" in result
@@ -145,16 +106,6 @@ class TestConvertCv:
 
 
 class TestConvertTransformationPlan:
-    @pytest.fixture
-    def sample_plan(self):
-        return CvTransformationPlan(
-            job_title="Staff Engineer",
-            company="Globex",
-            matching_skills=["Python", "system design"],
-            missing_skills=["Rust"],
-            profession_update="Staff Software Engineer",
-        )
-
     def test_title_includes_job_and_company(self, converter, sample_plan):
         result = converter.convert_transformation_plan(sample_plan)
         assert "# Transformation Plan: Staff Engineer at Globex" in result
@@ -179,58 +130,7 @@ class TestConvertTransformationPlan:
 
 
 class TestGenericConvert:
-    @pytest.fixture
-    def sample_job_posting(self):
-        return JobPosting(
-            url="https://example.com/job/123",
-            company="Acme Corp",
-            title="Software Engineer",
-            industry="Technology",
-            description="Build great software",
-            experience_level="Mid-level",
-        )
-
-    @pytest.fixture
-    def sample_cv(self):
-        return CurriculumVitae(
-            name="Jane Doe",
-            profession="Software Engineer",
-            contact=Contact(
-                city="San Francisco", state="CA",
-                email="jane@example.com", phone="555-1234",
-                linkedin="linkedin.com/in/janedoe", github="github.com/janedoe",
-            ),
-            core_expertise=["Python"],
-            qualifications=["10 years"],
-            education=[], experience=[], additional_experience=[],
-            areas_of_expertise=[], languages=[],
-        )
-
-    @pytest.fixture
-    def sample_plan(self):
-        return CvTransformationPlan(
-            job_title="Staff Engineer", company="Globex",
-            matching_skills=["Python"], missing_skills=[],
-        )
-
-    def test_dispatches_job_posting_by_class_name(self, converter, sample_job_posting):
-        result = converter.convert(sample_job_posting)
-        assert "# Software Engineer at Acme Corp" in result
-
-    def test_dispatches_cv_by_class_name(self, converter, sample_cv):
-        result = converter.convert(sample_cv)
-        assert "# Jane Doe" in result
-
-    def test_dispatches_plan_by_class_name(self, converter, sample_plan):
-        result = converter.convert(sample_plan)
-        assert "# Transformation Plan: Staff Engineer at Globex" in result
-
     def test_returns_none_for_unknown_type(self, converter):
-        from pydantic import BaseModel
         class Unknown(BaseModel):
             x: int = 1
         assert converter.convert(Unknown()) is None
-
-    def test_no_frontmatter_in_output(self, converter, sample_plan):
-        result = converter.convert(sample_plan)
-        assert not result.startswith("---")
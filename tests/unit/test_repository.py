@@ -4,18 +4,24 @@ Unit tests for filesystem repository.
 
 import pytest
 import shutil
-import tempfile
+from datetime import datetime
 from pathlib import Path
 
 from repositories import FileSystemRepository
 from repositories.filesystem import parse_uri
-from models import JobPosting, CurriculumVitae, CoverLetter
+from models import (
+    Contact,
+    CoverLetter,
+    CoverLetterRecord,
+    CurriculumVitaeRecord,
+    JobPostingRecord,
+    OptimizedCvRecord,
+)
 
 
 @pytest.fixture
-def temp_data_dir():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+def temp_data_dir(tmp_path):
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -23,49 +29,8 @@ def repository(temp_data_dir):
     return FileSystemRepository(data_dir=temp_data_dir)
 
 
-@pytest.fixture
-def sample_job_posting():
-    return JobPosting(
-        url="https://example.com/job/123",
-        company="Acme Corp",
-        title="Software Engineer",
-        industry="Technology",
-        description="Build great software",
-        experience_level="Mid-level",
-        responsibilities=["Write code", "Review PRs"],
-        technical_skills=["Python", "Testing"],
-    )
-
-
-@pytest.fixture
-def sample_cv():
-    from models import Contact
-
-    return CurriculumVitae(
-        name="Jane Doe",
-        profession="Software Engineer",
-        contact=Contact(
-            city="San Francisco",
-            state="CA",
-            email="jane@example.com",
-            phone="555-1234",
-            linkedin="linkedin.com/in/janedoe",
-            github="github.com/janedoe",
-        ),
-        core_expertise=["Python", "Testing"],
-        qualifications=["10 years experience"],
-        education=[],
-        experience=[],
-        additional_experience=[],
-        areas_of_expertise=[],
-        languages=[],
-    )
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_cover_letter():
-    from models import Contact
-
     return CoverLetter(
         name="Wesley Hinkle",
         contact=Contact(
@@ -83,18 +48,17 @@ def sample_cover_letter():
 
 
 class TestFileSystemRepositoryInit:
-    def test_creates_collections_directory(self, temp_data_dir):
+    def test_creates_collections_directory(self, temp_data_dir, data_path):
         repo = FileSystemRepository(data_dir=temp_data_dir)
-        assert (Path(temp_data_dir) / "collections").exists()
+        assert data_path("collections").exists()
 
     def test_sets_data_dir(self, temp_data_dir):
         repo = FileSystemRepository(data_dir=temp_data_dir)
         assert repo.data_dir == Path(temp_data_dir)
 
-    def test_expands_user_path(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            repo = FileSystemRepository(data_dir=tmpdir)
-            assert "~" not in str(repo.data_dir)
+    def test_expands_user_path(self, temp_data_dir):
+        repo = FileSystemRepository(data_dir=temp_data_dir)
+        assert "~" not in str(repo.data_dir)
 
 
 class TestJobPostingOperations:
@@ -112,19 +76,25 @@ class TestJobPostingOperations:
 
         listings = repository.list_job_postings()
         assert len(listings) == 2
-        identifiers = [item["identifier"] for item in listings]
-        assert "job-1" in identifiers
-        assert "job-2" in identifiers
+        identifiers = {item["identifier"] for item in listings}
+        assert identifiers == {"job-1", "job-2"}
+
+    def test_collection_index_saved_without_leftover_temp_file(
+        self, repository, sample_job_posting, data_path
+    ):
+        repository.add_job_posting(sample_job_posting, "job-1")
+        collections_dir = data_path("collections")
+        assert [p.name for p in collections_dir.iterdir()] == ["job-postings.json"]
 
     def test_list_job_postings_empty(self, repository):
         listings = repository.list_job_postings()
         assert listings == []
 
-    def test_remove_job_posting(self, repository, sample_job_posting, temp_data_dir):
+    def test_remove_job_posting(self, repository, sample_job_posting, data_path):
         repository.add_job_posting(sample_job_posting, "to-delete")
         assert repository.remove_job_posting("to-delete") is True
         assert repository.get_job_posting("to-delete") is None
-        assert not (Path(temp_data_dir) / "job-postings" / "to-delete").exists()
+        assert not data_path("job-postings", "to-delete").exists()
 
     def test_remove_job_posting_not_in_listing(self, repository, sample_job_posting):
         repository.add_job_posting(sample_job_posting, "to-delete")
@@ -140,12 +110,10 @@ class TestJobPostingOperations:
             repository.add_job_posting(sample_job_posting, "update-test")
 
     def test_job_posting_stored_in_correct_location(
-        self, repository, sample_job_posting, temp_data_dir
+        self, repository, sample_job_posting, data_path
     ):
         repository.add_job_posting(sample_job_posting, "location-test")
-        expected_path = (
-            Path(temp_data_dir) / "job-postings" / "location-test" / "job-posting.json"
-        )
+        expected_path = data_path("job-postings", "location-test", "job-posting.json")
         assert expected_path.exists()
 
     def test_get_job_posting_record(self, repository, sample_job_posting):
@@ -171,9 +139,8 @@ class TestJobPostingOperations:
         repository.archive_job_posting("archived-job")
 
         listings = repository.list_job_postings()
-        identifiers = [item["identifier"] for item in listings]
-        assert "active-job" in identifiers
-        assert "archived-job" not in identifiers
+        identifiers = {item["identifier"] for item in listings}
+        assert identifiers == {"active-job"}
 
     def test_list_job_postings_by_location(
         self, repository, sample_job_posting
@@ -183,9 +150,8 @@ class TestJobPostingOperations:
         repository.archive_job_posting("archived-job")
 
         listings = repository.list_job_postings(location="archived")
-        identifiers = [item["identifier"] for item in listings]
-        assert "active-job" not in identifiers
-        assert "archived-job" in identifiers
+        identifiers = {item["identifier"] for item in listings}
+        assert identifiers == {"archived-job"}
 
     def test_list_job_postings_all_returns_every_record(
         self, repository, sample_job_posting
@@ -195,9 +161,8 @@ class TestJobPostingOperations:
         repository.archive_job_posting("archived-job")
 
         listings = repository.list_job_postings(all=True)
-        identifiers = [item["identifier"] for item in listings]
-        assert "active-job" in identifiers
-        assert "archived-job" in identifiers
+        identifiers = {item["identifier"] for item in listings}
+        assert identifiers == {"active-job", "archived-job"}
 
     def test_archive_job_posting_sets_location(self, repository, sample_job_posting):
         repository.add_job_posting(sample_job_posting, "test-job")
@@ -207,14 +172,12 @@ class TestJobPostingOperations:
         assert repository.get_job_posting_record("test-job").location == "archived"
 
     def test_archive_job_posting_updates_updated_at(self, repository, sample_job_posting):
-        from datetime import datetime
         repository.add_job_posting(sample_job_posting, "test-job")
         before = datetime.now()
         record = repository.archive_job_posting("test-job")
         assert record.updated_at >= before
 
     def test_mark_applied_sets_fields(self, repository, sample_job_posting):
-        from datetime import datetime
         repository.add_job_posting(sample_job_posting, "test-job")
         before = datetime.now()
         record = repository.mark_applied("test-job", "my-cv")
@@ -227,7 +190,6 @@ class TestJobPostingOperations:
         assert reloaded.applied_at is not None
 
     def test_mark_applied_accepts_explicit_date(self, repository, sample_job_posting):
-        from datetime import datetime
 
         date = datetime(2025, 1, 15)
         repository.add_job_posting(sample_job_posting, "test-job")
@@ -252,19 +214,18 @@ class TestCvOperations:
 
         listings = repository.list_cvs()
         assert len(listings) == 2
-        identifiers = [item["identifier"] for item in listings]
-        assert "cv-1" in identifiers
-        assert "cv-2" in identifiers
+        identifiers = {item["identifier"] for item in listings}
+        assert identifiers == {"cv-1", "cv-2"}
 
     def test_list_cvs_empty(self, repository):
         listings = repository.list_cvs()
         assert listings == []
 
-    def test_remove_cv(self, repository, sample_cv, temp_data_dir):
+    def test_remove_cv(self, repository, sample_cv, data_path):
         repository.add_cv(sample_cv, "to-delete")
         assert repository.remove_cv("to-delete") is True
         assert repository.get_cv("to-delete") is None
-        assert not (Path(temp_data_dir) / "cvs" / "to-delete").exists()
+        assert not data_path("cvs", "to-delete").exists()
 
     def test_remove_cv_not_in_listing(self, repository, sample_cv):
         repository.add_cv(sample_cv, "to-delete")
@@ -274,9 +235,9 @@ class TestCvOperations:
     def test_remove_nonexistent_cv(self, repository):
         assert repository.remove_cv("nonexistent") is False
 
-    def test_cv_stored_in_correct_location(self, repository, sample_cv, temp_data_dir):
+    def test_cv_stored_in_correct_location(self, repository, sample_cv, data_path):
         repository.add_cv(sample_cv, "location-test")
-        expected_path = Path(temp_data_dir) / "cvs" / "location-test" / "curriculum-vitae.json"
+        expected_path = data_path("cvs", "location-test", "curriculum-vitae.json")
         assert expected_path.exists()
 
     def test_get_cv_record(self, repository, sample_cv):
@@ -304,11 +265,11 @@ class TestRenameJobPosting:
         with pytest.raises(ValueError, match="already exists"):
             repository.rename_job_posting("job-1", "job-2")
 
-    def test_renames_directory(self, repository, sample_job_posting, temp_data_dir):
+    def test_renames_directory(self, repository, sample_job_posting, data_path):
         repository.add_job_posting(sample_job_posting, "old-id")
         repository.rename_job_posting("old-id", "new-id")
-        assert not (Path(temp_data_dir) / "job-postings" / "old-id").exists()
-        assert (Path(temp_data_dir) / "job-postings" / "new-id").exists()
+        assert not data_path("job-postings", "old-id").exists()
+        assert data_path("job-postings", "new-id").exists()
 
     def test_updates_collection(self, repository, sample_job_posting):
         repository.add_job_posting(sample_job_posting, "old-id")
@@ -342,11 +303,11 @@ class TestRenameCv:
         with pytest.raises(ValueError, match="already exists"):
             repository.rename_cv("cv-1", "cv-2")
 
-    def test_renames_directory(self, repository, sample_cv, temp_data_dir):
+    def test_renames_directory(self, repository, sample_cv, data_path):
         repository.add_cv(sample_cv, "old-id")
         repository.rename_cv("old-id", "new-id")
-        assert not (Path(temp_data_dir) / "cvs" / "old-id").exists()
-        assert (Path(temp_data_dir) / "cvs" / "new-id").exists()
+        assert not data_path("cvs", "old-id").exists()
+        assert data_path("cvs", "new-id").exists()
 
     def test_updates_collection(self, repository, sample_cv):
         repository.add_cv(sample_cv, "old-id")
@@ -381,18 +342,17 @@ class TestCoverLetterOperations:
 
         listings = repository.list_cover_letters()
         assert len(listings) == 2
-        identifiers = [item["identifier"] for item in listings]
-        assert "letter-1" in identifiers
-        assert "letter-2" in identifiers
+        identifiers = {item["identifier"] for item in listings}
+        assert identifiers == {"letter-1", "letter-2"}
 
     def test_list_cover_letters_empty(self, repository):
         assert repository.list_cover_letters() == []
 
-    def test_remove_cover_letter(self, repository, sample_cover_letter, temp_data_dir):
+    def test_remove_cover_letter(self, repository, sample_cover_letter, data_path):
         repository.add_cover_letter(sample_cover_letter, "to-delete")
         assert repository.remove_cover_letter("to-delete") is True
         assert repository.get_cover_letter("to-delete") is None
-        assert not (Path(temp_data_dir) / "cover-letters" / "to-delete").exists()
+        assert not data_path("cover-letters", "to-delete").exists()
 
     def test_remove_cover_letter_not_in_listing(self, repository, sample_cover_letter):
         repository.add_cover_letter(sample_cover_letter, "to-delete")
@@ -411,15 +371,10 @@ class TestCoverLetterOperations:
             repository.add_cover_letter(sample_cover_letter, "dupe")
 
     def test_cover_letter_stored_in_correct_location(
-        self, repository, sample_cover_letter, temp_data_dir
+        self, repository, sample_cover_letter, data_path
     ):
         repository.add_cover_letter(sample_cover_letter, "location-test")
-        expected_path = (
-            Path(temp_data_dir)
-            / "cover-letters"
-            / "location-test"
-            / "cover-letter.json"
-        )
+        expected_path = data_path("cover-letters", "location-test", "cover-letter.json")
         assert expected_path.exists()
 
     def test_get_cover_letter_record(self, repository, sample_cover_letter):
@@ -460,11 +415,11 @@ class TestRenameCoverLetter:
         with pytest.raises(ValueError, match="already exists"):
             repository.rename_cover_letter("letter-1", "letter-2")
 
-    def test_renames_directory(self, repository, sample_cover_letter, temp_data_dir):
+    def test_renames_directory(self, repository, sample_cover_letter, data_path):
         repository.add_cover_letter(sample_cover_letter, "old-id")
         repository.rename_cover_letter("old-id", "new-id")
-        assert not (Path(temp_data_dir) / "cover-letters" / "old-id").exists()
-        assert (Path(temp_data_dir) / "cover-letters" / "new-id").exists()
+        assert not data_path("cover-letters", "old-id").exists()
+        assert data_path("cover-letters", "new-id").exists()
 
     def test_updates_collection(self, repository, sample_cover_letter):
         repository.add_cover_letter(sample_cover_letter, "old-id")
@@ -489,8 +444,6 @@ class TestRenameCoverLetter:
 
 class TestOptimizedCvRecord:
     def test_constructs_with_required_fields(self):
-        from models import OptimizedCvRecord
-        from datetime import datetime
 
         record = OptimizedCvRecord(
             identifier="opt-1",
@@ -507,12 +460,9 @@ class TestOptimizedCvRecord:
         assert record.profession == "Software Engineer"
 
     def test_has_no_transformation_plan_filepath(self):
-        from models import OptimizedCvRecord
         assert not hasattr(OptimizedCvRecord.model_fields, "transformation_plan_filepath")
 
     def test_optional_job_title_and_company(self):
-        from models import OptimizedCvRecord
-        from datetime import datetime
 
         record = OptimizedCvRecord(
             identifier="opt-1",
@@ -610,7 +560,7 @@ class TestRemoveUsesStoredPath:
         repository._save_collection(collection_file, collection)
 
     def test_remove_job_posting_deletes_custom_path(
-        self, repository, sample_job_posting, temp_data_dir
+        self, repository, sample_job_posting, data_path
     ):
         repository.add_job_posting(sample_job_posting, "to-delete")
         self._move_to_custom_path(
@@ -624,10 +574,10 @@ class TestRemoveUsesStoredPath:
         result = repository.remove_job_posting("to-delete")
 
         assert result is True
-        assert not (Path(temp_data_dir) / "archived/job-postings/to-delete").exists()
+        assert not data_path("archived", "job-postings", "to-delete").exists()
 
     def test_remove_cv_deletes_custom_path(
-        self, repository, sample_cv, temp_data_dir
+        self, repository, sample_cv, data_path
     ):
         repository.add_cv(sample_cv, "to-delete")
         self._move_to_custom_path(
@@ -641,7 +591,7 @@ class TestRemoveUsesStoredPath:
         result = repository.remove_cv("to-delete")
 
         assert result is True
-        assert not (Path(temp_data_dir) / "archived/cvs/to-delete").exists()
+        assert not data_path("archived", "cvs", "to-delete").exists()
 
 
 class TestListCvsBaseOnly:
@@ -690,21 +640,18 @@ class TestParseUri:
 
 class TestResolveRecord:
     def test_resolves_job_posting(self, repository, sample_job_posting):
-        from models import JobPostingRecord
         repository.add_job_posting(sample_job_posting, "acme-swe")
         record = repository.resolve_record("job-postings/acme-swe")
         assert isinstance(record, JobPostingRecord)
         assert record.identifier == "acme-swe"
 
     def test_resolves_cv(self, repository, sample_cv):
-        from models import CurriculumVitaeRecord
         repository.add_cv(sample_cv, "jane-doe")
         record = repository.resolve_record("cvs/jane-doe")
         assert isinstance(record, CurriculumVitaeRecord)
         assert record.identifier == "jane-doe"
 
     def test_resolves_optimized_cv(self, repository, sample_job_posting, sample_cv):
-        from models import OptimizedCvRecord
         repository.add_job_posting(sample_job_posting, "acme-swe")
         repository.add_optimized_cv("acme-swe", "jane-v2", "jane-doe", sample_cv)
         record = repository.resolve_record("job-postings/acme-swe/cvs/jane-v2")
@@ -712,7 +659,6 @@ class TestResolveRecord:
         assert record.identifier == "jane-v2"
 
     def test_resolves_cover_letter(self, repository, sample_cover_letter):
-        from models import CoverLetterRecord
         repository.add_cover_letter(sample_cover_letter, "frobozzco-magic-gunk")
         record = repository.resolve_record("cover-letters/frobozzco-magic-gunk")
         assert isinstance(record, CoverLetterRecord)
@@ -763,7 +709,7 @@ class TestRenameUsesStoredPath:
         repository._save_collection(collection_file, collection)
 
     def test_rename_job_posting_uses_stored_path(
-        self, repository, sample_job_posting, temp_data_dir
+        self, repository, sample_job_posting, data_path
     ):
         repository.add_job_posting(sample_job_posting, "old-id")
         self._move_to_custom_path(
@@ -774,11 +720,11 @@ class TestRenameUsesStoredPath:
             "custom/old-id",
         )
         repository.rename_job_posting("old-id", "new-id")
-        assert not (Path(temp_data_dir) / "custom/old-id").exists()
-        assert (Path(temp_data_dir) / "custom/new-id").exists()
+        assert not data_path("custom", "old-id").exists()
+        assert data_path("custom", "new-id").exists()
 
     def test_rename_cv_uses_stored_path(
-        self, repository, sample_cv, temp_data_dir
+        self, repository, sample_cv, data_path
     ):
         repository.add_cv(sample_cv, "old-id")
         self._move_to_custom_path(
@@ -789,5 +735,5 @@ class TestRenameUsesStoredPath:
             "custom/old-id",
         )
         repository.rename_cv("old-id", "new-id")
-        assert not (Path(temp_data_dir) / "custom/old-id").exists()
-        assert (Path(temp_data_dir) / "custom/new-id").exists()
+        assert not data_path("custom", "old-id").exists()
+        assert data_path("custom", "new-id").exists()
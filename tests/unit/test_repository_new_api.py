@@ -6,10 +6,9 @@ list_optimized_cvs, remove_optimized_cv, rename_optimized_cv.
 """
 
 import json
+import os
 import shutil
 import pytest
-import tempfile
-from pathlib import Path
 
 from repositories import FileSystemRepository
 from models import (
@@ -17,15 +16,13 @@ from models import (
     CurriculumVitae,
     Contact,
     CvTransformationPlan,
-    JobPosting,
     OptimizedCvRecord,
 )
 
 
 @pytest.fixture
-def temp_data_dir():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+def temp_data_dir(tmp_path):
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -33,52 +30,13 @@ def repository(temp_data_dir):
     return FileSystemRepository(data_dir=temp_data_dir)
 
 
-@pytest.fixture
-def sample_cv():
-    return CurriculumVitae(
-        name="Jane Doe",
-        profession="Software Engineer",
-        contact=Contact(
-            city="San Francisco", state="CA",
-            email="jane@example.com", phone="555-1234",
-            linkedin="linkedin.com/in/janedoe", github="github.com/janedoe",
-        ),
-        core_expertise=["Python"],
-        qualifications=["10 years experience"],
-        education=[], experience=[], additional_experience=[],
-        areas_of_expertise=[], languages=[],
-    )
-
-
-@pytest.fixture
-def sample_job_posting():
-    return JobPosting(
-        url="https://example.com/job/123",
-        company="Acme Corp",
-        title="Software Engineer",
-        industry="Technology",
-        description="Build great software",
-        experience_level="Mid-level",
-    )
-
-
-@pytest.fixture
-def sample_plan():
-    return CvTransformationPlan(
-        job_title="Software Engineer",
-        company="Acme Corp",
-        matching_skills=["Python"],
-        missing_skills=[],
-    )
-
-
 @pytest.fixture
 def repository_with_job_posting(repository, sample_job_posting):
     repository.add_job_posting(sample_job_posting, "acme-swe")
     return repository
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_cover_letter():
     return CoverLetter(
         name="Jane Doe",
@@ -102,28 +60,28 @@ def repository_with_cover_letter(repository, sample_cover_letter):
 
 class TestSaveObject:
     def test_writes_json_to_path_derived_from_class_name(
-        self, repository, sample_plan, temp_data_dir
+        self, repository, sample_plan, data_path
     ):
         repository.save_object("job-postings/acme-swe/cvs/opt-1", sample_plan)
-        expected = Path(temp_data_dir) / "job-postings" / "acme-swe" / "cvs" / "opt-1" / "cv-transformation-plan.json"
+        expected = data_path("job-postings", "acme-swe", "cvs", "opt-1", "cv-transformation-plan.json")
         assert expected.exists()
 
-    def test_includes_type_field(self, repository, sample_plan, temp_data_dir):
+    def test_includes_type_field(self, repository, sample_plan, data_path):
         repository.save_object("job-postings/acme-swe/cvs/opt-1", sample_plan)
-        path = Path(temp_data_dir) / "job-postings" / "acme-swe" / "cvs" / "opt-1" / "cv-transformation-plan.json"
+        path = data_path("job-postings", "acme-swe", "cvs", "opt-1", "cv-transformation-plan.json")
         data = json.loads(path.read_text())
         assert data["_type"] == "CvTransformationPlan"
 
-    def test_creates_parent_directories(self, repository, sample_plan, temp_data_dir):
+    def test_creates_parent_directories(self, repository, sample_plan, data_path):
         repository.save_object("job-postings/new-job/cvs/new-opt", sample_plan)
-        assert (Path(temp_data_dir) / "job-postings" / "new-job" / "cvs" / "new-opt").exists()
+        assert data_path("job-postings", "new-job", "cvs", "new-opt").exists()
 
-    def test_serializes_object_fields(self, repository, sample_plan, temp_data_dir):
+    def test_serializes_object_fields(self, repository, sample_plan, data_path):
         repository.save_object("job-postings/acme-swe/cvs/opt-1", sample_plan)
-        path = Path(temp_data_dir) / "job-postings" / "acme-swe" / "cvs" / "opt-1" / "cv-transformation-plan.json"
+        path = data_path("job-postings", "acme-swe", "cvs", "opt-1", "cv-transformation-plan.json")
         data = json.loads(path.read_text())
-        assert data["job_title"] == "Software Engineer"
-        assert data["company"] == "Acme Corp"
+        assert data["job_title"] == "Staff Engineer"
+        assert data["company"] == "Globex"
 
 
 class TestLoadObject:
@@ -131,7 +89,7 @@ class TestLoadObject:
         repository.save_object("job-postings/acme-swe/cvs/opt-1", sample_plan)
         result = repository.load_object("job-postings/acme-swe/cvs/opt-1", CvTransformationPlan)
         assert isinstance(result, CvTransformationPlan)
-        assert result.job_title == "Software Engineer"
+        assert result.job_title == "Staff Engineer"
 
     def test_returns_none_when_not_found(self, repository):
         result = repository.load_object("job-postings/acme-swe/cvs/opt-1", CvTransformationPlan)
@@ -151,54 +109,76 @@ class TestLoadAllObjects:
         result = repository.load_all_objects("job-postings/acme-swe/cvs/opt-1")
         assert isinstance(result["cv-transformation-plan"], CvTransformationPlan)
 
-    def test_skips_files_without_type_field(self, repository, temp_data_dir):
-        opt_dir = Path(temp_data_dir) / "job-postings" / "acme-swe" / "cvs" / "opt-1"
+    def test_skips_files_without_type_field(self, repository, data_path):
+        opt_dir = data_path("job-postings", "acme-swe", "cvs", "opt-1")
         opt_dir.mkdir(parents=True)
         (opt_dir / "no-type.json").write_text('{"foo": "bar"}')
         result = repository.load_all_objects("job-postings/acme-swe/cvs/opt-1")
         assert "no-type" not in result
 
-    def test_skips_files_with_unrecognised_type(self, repository, temp_data_dir):
-        opt_dir = Path(temp_data_dir) / "job-postings" / "acme-swe" / "cvs" / "opt-1"
+    def test_skips_files_with_unrecognised_type(self, repository, data_path):
+        opt_dir = data_path("job-postings", "acme-swe", "cvs", "opt-1")
         opt_dir.mkdir(parents=True)
         (opt_dir / "unknown.json").write_text('{"_type": "SomeUnknownClass", "data": 1}')
         result = repository.load_all_objects("job-postings/acme-swe/cvs/opt-1")
         assert "unknown" not in result
 
+    def test_skips_directories_named_like_json(self, repository, sample_plan, data_path):
+        repository.save_object("job-postings/acme-swe/cvs/opt-1", sample_plan)
+        opt_dir = data_path("job-postings", "acme-swe", "cvs", "opt-1")
+        (opt_dir / "nested.json").mkdir()
+        result = repository.load_all_objects("job-postings/acme-swe/cvs/opt-1")
+        assert list(result) == ["cv-transformation-plan"]
+
     def test_returns_empty_dict_for_nonexistent_directory(self, repository):
         result = repository.load_all_objects("job-postings/nonexistent/cvs/opt-1")
         assert result == {}
 
 
 class TestSaveDocument:
-    def test_prepends_frontmatter_for_owned_stem(self, repository_with_job_posting, temp_data_dir):
+    def test_prepends_frontmatter_for_owned_stem(self, repository_with_job_posting, data_path):
         repository_with_job_posting.save_document("job-postings/acme-swe/job-posting.md", "# Acme\n")
-        path = Path(temp_data_dir) / "job-postings" / "acme-swe" / "job-posting.md"
+        path = data_path("job-postings", "acme-swe", "job-posting.md")
         content = path.read_text()
         assert content.startswith("---\n")
         assert "identifier: acme-swe" in content
         assert "# Acme" in content
 
-    def test_prepends_frontmatter_for_cover_letter(self, repository_with_cover_letter, temp_data_dir):
+    def test_prepends_frontmatter_for_cover_letter(self, repository_with_cover_letter, data_path):
         repository_with_cover_letter.save_document("cover-letters/jane-acme/cover-letter.md", "# Letter\n")
-        path = Path(temp_data_dir) / "cover-letters" / "jane-acme" / "cover-letter.md"
+        path = data_path("cover-letters", "jane-acme", "cover-letter.md")
         content = path.read_text()
         assert content.startswith("---\n")
         assert "identifier: jane-acme" in content
         assert "# Letter" in content
 
-    def test_no_frontmatter_for_unowned_stem(self, repository_with_job_posting, temp_data_dir):
+    def test_no_frontmatter_for_unowned_stem(self, repository_with_job_posting, data_path):
         repository_with_job_posting.save_document("job-postings/acme-swe/readme.md", "# Notes\n")
-        path = Path(temp_data_dir) / "job-postings" / "acme-swe" / "readme.md"
+        path = data_path("job-postings", "acme-swe", "readme.md")
         assert path.read_text() == "# Notes\n"
 
     def test_raises_for_unknown_uri(self, repository):
         with pytest.raises(ValueError):
             repository.save_document("job-postings/nonexistent/job-posting.md", "content")
 
-    def test_creates_directory_if_absent(self, repository_with_job_posting, temp_data_dir):
+    def test_creates_directory_if_absent(self, repository_with_job_posting, data_path):
         repository_with_job_posting.save_document("job-postings/acme-swe/job-posting.md", "content")
-        assert (Path(temp_data_dir) / "job-postings" / "acme-swe").exists()
+        assert data_path("job-postings", "acme-swe").exists()
+
+    def test_skips_write_when_content_unchanged(self, repository_with_job_posting, data_path):
+        path = data_path("job-postings", "acme-swe", "readme.md")
+        repository_with_job_posting.save_document("job-postings/acme-swe/readme.md", "# Notes\n")
+        os.utime(path, ns=(0, 0))
+        repository_with_job_posting.save_document("job-postings/acme-swe/readme.md", "# Notes\n")
+        assert path.stat().st_mtime_ns == 0
+        repository_with_job_posting.save_document("job-postings/acme-swe/readme.md", "# Changed\n")
+        assert path.read_text() == "# Changed\n"
+
+    def test_overwrites_existing_non_utf8_document(self, repository_with_job_posting, data_path):
+        path = data_path("job-postings", "acme-swe", "notes.md")
+        path.write_bytes("# Zürich\n".encode("latin-1"))
+        repository_with_job_posting.save_document("job-postings/acme-swe/notes.md", "# Zürich\n")
+        assert path.read_bytes() == "# Zürich\n".encode("utf-8")
 
 
 class TestLoadDocument:
@@ -219,33 +199,33 @@ class TestDocumentExists:
 
 class TestPatchDocumentFrontmatter:
     def test_merges_record_fields_into_frontmatter(
-        self, repository_with_job_posting, temp_data_dir
+        self, repository_with_job_posting, data_path
     ):
         repository_with_job_posting.save_document(
             "job-postings/acme-swe/job-posting.md", "# Acme\n\nBody text.\n"
         )
         repository_with_job_posting.archive_job_posting("acme-swe")
-        path = Path(temp_data_dir) / "job-postings" / "archived" / "acme-swe" / "job-posting.md"
+        path = data_path("job-postings", "archived", "acme-swe", "job-posting.md")
         content = path.read_text()
         assert content.startswith("---\n")
         assert "location: archived" in content
 
     def test_preserves_hand_added_frontmatter_keys(
-        self, repository_with_job_posting, temp_data_dir
+        self, repository_with_job_posting, data_path
     ):
-        src = Path(temp_data_dir) / "job-postings" / "acme-swe" / "job-posting.md"
+        src = data_path("job-postings", "acme-swe", "job-posting.md")
         src.parent.mkdir(parents=True, exist_ok=True)
         src.write_text("---\ncustom_tag: keep-me\n---\n# Acme\n")
         repository_with_job_posting.archive_job_posting("acme-swe")
-        path = Path(temp_data_dir) / "job-postings" / "archived" / "acme-swe" / "job-posting.md"
+        path = data_path("job-postings", "archived", "acme-swe", "job-posting.md")
         assert "custom_tag: keep-me" in path.read_text()
 
-    def test_preserves_body_content(self, repository_with_job_posting, temp_data_dir):
+    def test_preserves_body_content(self, repository_with_job_posting, data_path):
         repository_with_job_posting.save_document(
             "job-postings/acme-swe/job-posting.md", "# Acme\n\nHand-edited paragraph.\n"
         )
         repository_with_job_posting.archive_job_posting("acme-swe")
-        path = Path(temp_data_dir) / "job-postings" / "archived" / "acme-swe" / "job-posting.md"
+        path = data_path("job-postings", "archived", "acme-swe", "job-posting.md")
         assert "Hand-edited paragraph." in path.read_text()
 
     def test_skips_nonexistent_markdown_files(self, repository_with_job_posting):
@@ -253,31 +233,31 @@ class TestPatchDocumentFrontmatter:
         repository_with_job_posting.archive_job_posting("acme-swe")
 
     def test_skips_file_with_missing_frontmatter_block(
-        self, repository_with_job_posting, temp_data_dir
+        self, repository_with_job_posting, data_path
     ):
-        path = Path(temp_data_dir) / "job-postings" / "acme-swe" / "job-posting.md"
+        path = data_path("job-postings", "acme-swe", "job-posting.md")
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text("# No frontmatter here\n")
         # Should not raise; file without frontmatter is skipped gracefully
         record = repository_with_job_posting.archive_job_posting("acme-swe")
         assert record.location == "archived"
-        moved = Path(temp_data_dir) / "job-postings" / "archived" / "acme-swe" / "job-posting.md"
+        moved = data_path("job-postings", "archived", "acme-swe", "job-posting.md")
         assert "# No frontmatter here" in moved.read_text()
 
 
 class TestUpsertOptimizedCv:
     def test_saves_curriculum_vitae_json_in_optimization_directory(
-        self, repository_with_job_posting, sample_cv, temp_data_dir
+        self, repository_with_job_posting, sample_cv, data_path
     ):
         repository_with_job_posting.add_optimized_cv("acme-swe", "opt-1", "jane-doe", sample_cv)
-        cv_path = Path(temp_data_dir) / "job-postings" / "acme-swe" / "cvs" / "opt-1" / "curriculum-vitae.json"
+        cv_path = data_path("job-postings", "acme-swe", "cvs", "opt-1", "curriculum-vitae.json")
         assert cv_path.exists()
 
     def test_writes_record_to_collection(
-        self, repository_with_job_posting, sample_cv, temp_data_dir
+        self, repository_with_job_posting, sample_cv, data_path
     ):
         repository_with_job_posting.add_optimized_cv("acme-swe", "opt-1", "jane-doe", sample_cv)
-        collection_path = Path(temp_data_dir) / "collections" / "optimized-cvs.json"
+        collection_path = data_path("collections", "optimized-cvs.json")
         assert collection_path.exists()
         data = json.loads(collection_path.read_text())
         assert any(r["identifier"] == "opt-1" for r in data)
@@ -357,13 +337,13 @@ class TestListOptimizedCvs:
 
 class TestRemoveOptimizedCv:
     def test_removes_from_collection_and_deletes_directory(
-        self, repository_with_job_posting, sample_cv, temp_data_dir
+        self, repository_with_job_posting, sample_cv, data_path
     ):
         repository_with_job_posting.add_optimized_cv("acme-swe", "opt-1", "jane-doe", sample_cv)
         result = repository_with_job_posting.remove_optimized_cv("acme-swe", "opt-1")
         assert result is True
         assert repository_with_job_posting.get_optimized_cv_record("acme-swe", "opt-1") is None
-        opt_dir = Path(temp_data_dir) / "job-postings" / "acme-swe" / "cvs" / "opt-1"
+        opt_dir = data_path("job-postings", "acme-swe", "cvs", "opt-1")
         assert not opt_dir.exists()
 
     def test_returns_false_when_not_found(self, repository_with_job_posting):
@@ -372,12 +352,12 @@ class TestRemoveOptimizedCv:
 
 class TestRenameOptimizedCv:
     def test_renames_directory(
-        self, repository_with_job_posting, sample_cv, temp_data_dir
+        self, repository_with_job_posting, sample_cv, data_path
     ):
         repository_with_job_posting.add_optimized_cv("acme-swe", "old-id", "jane-doe", sample_cv)
         repository_with_job_posting.rename_optimized_cv("acme-swe", "old-id", "new-id")
-        assert not (Path(temp_data_dir) / "job-postings" / "acme-swe" / "cvs" / "old-id").exists()
-        assert (Path(temp_data_dir) / "job-postings" / "acme-swe" / "cvs" / "new-id").exists()
+        assert not data_path("job-postings", "acme-swe", "cvs", "old-id").exists()
+        assert data_path("job-postings", "acme-swe", "cvs", "new-id").exists()
 
     def test_updates_collection(self, repository_with_job_posting, sample_cv):
         repository_with_job_posting.add_optimized_cv("acme-swe", "old-id", "jane-doe", sample_cv)
@@ -417,13 +397,13 @@ class TestOptimizedCvUsesParentPath:
         repository._save_collection(repository.job_postings_collection, collection)
 
     def test_add_optimized_cv_saves_under_parent_stored_path(
-        self, repository_with_job_posting, sample_cv, temp_data_dir
+        self, repository_with_job_posting, sample_cv, data_path
     ):
         self._move_job_posting(
             repository_with_job_posting, "acme-swe", "job-postings/archived/acme-swe"
         )
         repository_with_job_posting.add_optimized_cv("acme-swe", "opt-1", "jane-doe", sample_cv)
-        correct = Path(temp_data_dir) / "job-postings/archived/acme-swe/cvs/opt-1/curriculum-vitae.json"
+        correct = data_path("job-postings", "archived", "acme-swe", "cvs", "opt-1", "curriculum-vitae.json")
         assert correct.exists()
 
     def test_get_optimized_cv_reads_from_parent_stored_path(
@@ -438,27 +418,27 @@ class TestOptimizedCvUsesParentPath:
         assert result is not None
 
     def test_remove_optimized_cv_deletes_from_parent_stored_path(
-        self, repository_with_job_posting, sample_cv, temp_data_dir
+        self, repository_with_job_posting, sample_cv, data_path
     ):
         repository_with_job_posting.add_optimized_cv("acme-swe", "opt-1", "jane-doe", sample_cv)
         self._move_job_posting(
             repository_with_job_posting, "acme-swe", "job-postings/archived/acme-swe"
         )
-        cv_dir = Path(temp_data_dir) / "job-postings/archived/acme-swe/cvs/opt-1"
+        cv_dir = data_path("job-postings", "archived", "acme-swe", "cvs", "opt-1")
         assert cv_dir.exists()
         repository_with_job_posting.remove_optimized_cv("acme-swe", "opt-1")
         assert not cv_dir.exists()
 
     def test_rename_optimized_cv_uses_parent_stored_path(
-        self, repository_with_job_posting, sample_cv, temp_data_dir
+        self, repository_with_job_posting, sample_cv, data_path
     ):
         repository_with_job_posting.add_optimized_cv("acme-swe", "old-id", "jane-doe", sample_cv)
         self._move_job_posting(
             repository_with_job_posting, "acme-swe", "job-postings/archived/acme-swe"
         )
         repository_with_job_posting.rename_optimized_cv("acme-swe", "old-id", "new-id")
-        assert not (Path(temp_data_dir) / "job-postings/archived/acme-swe/cvs/old-id").exists()
-        assert (Path(temp_data_dir) / "job-postings/archived/acme-swe/cvs/new-id").exists()
+        assert not data_path("job-postings", "archived", "acme-swe", "cvs", "old-id").exists()
+        assert data_path("job-postings", "archived", "acme-swe", "cvs", "new-id").exists()
 
 class TestTransitionAuditLog:
     def test_appends_entry_with_required_keys(self, repository_with_job_posting):